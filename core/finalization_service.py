@@ -66,8 +66,8 @@ class FinalizationService:
             # 3. Calculate Duration
             duration = time.time() - payload["start_time"]
             
-            # 4. Save to History
-            final_tokens = payload.get("final_tokens", TokenUsage())
+            # 4. Save to History (cost computed once, shared with the summary)
+            final_tokens = payload.get("final_tokens") or TokenUsage()
             estimated_cost = self._calculate_cost(payload, final_tokens)
             
             self._save_history(payload, output_mkv_path, duration, final_tokens, estimated_cost)
@@ -108,16 +108,18 @@ class FinalizationService:
             self.logger.warning(f"Failed to clean up temp files: {e}")
 
     def _calculate_cost(self, payload: Dict[str, Any], tokens: TokenUsage) -> Optional[float]:
-        """Calculate cost if applicable."""
+        """Calculate cost if applicable (only OpenRouter reports pricing)."""
+        if payload.get("provider") != "openrouter":
+            return None
         api_manager = payload.get("api_manager")
-        if api_manager:
-            model_info = api_manager.get_selected_model_info()
-            if model_info:
-                return model_info.calculate_cost(
-                    tokens.prompt_tokens,
-                    tokens.completion_tokens
-                )
-        return None
+        model_info = api_manager.get_selected_model_info() if api_manager else None
+        if not model_info:
+            return None
+        return model_info.calculate_cost(
+            tokens.prompt_tokens,
+            tokens.completion_tokens,
+            tokens.cached_prompt_tokens
+        )
 
     def _save_history(
         self, 
@@ -5,6 +5,8 @@ Manages the persistence and retrieval of translation session history.
 
 import json
 import os
+import queue
+import time
 import uuid
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -82,6 +84,11 @@ class HistoryManager:
         self.history_file = self.history_dir / self.HISTORY_FILENAME
         self.entries: List[HistoryEntry] = []
         self._load()
+        
+        # Saves run on a background writer so callers never wait on the JSON rewrite
+        self._save_queue: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
     
     def _load(self):
         """Load history from file."""
@@ -102,11 +109,53 @@ class HistoryManager:
             
     def _save(self):
         """Save history to file."""
+        with self._lock:
+            data = [item.to_dict() for item in self.entries]
         try:
             with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump([item.to_dict() for item in self.entries], f, indent=2, ensure_ascii=False)
+                json.dump(data, f, indent=2, ensure_ascii=False)
         except Exception as e:
             print(f"Warning: Failed to save history: {e}")
+    
+    def _schedule_save(self):
+        """Queue a save on the background writer."""
+        self._save_queue.put(None)
+    
+    def _writer_loop(self):
+        """Background writer; coalesces saves requested while one is in progress."""
+        while True:
+            self._save_queue.get()
+            pending = 1
+            while True:
+                try:
+                    self._save_queue.get_nowait()
+                    pending += 1
+                except queue.Empty:
+                    break
+            try:
+                self._save()
+            finally:
+                for _ in range(pending):
+                    self._save_queue.task_done()
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for queued saves to reach disk.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            True if all pending saves completed
+        """
+        deadline = time.monotonic() + timeout
+        with self._save_queue.all_tasks_done:
+            while self._save_queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._save_queue.all_tasks_done.wait(remaining)
+        return True
             
     def add_entry(self, entry: HistoryEntry):
         """Add a new history entry."""
@@ -115,7 +164,7 @@ class HistoryManager:
             # Limit history to 100 entries to prevent file bloating
             if len(self.entries) > 100:
                 self.entries = self.entries[:100]
-            self._save()
+            self._schedule_save()
             
     def get_entries(self) -> List[HistoryEntry]:
         """Get all history entries."""
@@ -126,20 +175,20 @@ class HistoryManager:
         """Delete a history entry by ID."""
         with self._lock:
             self.entries = [e for e in self.entries if e.id != entry_id]
-            self._save()
+            self._schedule_save()
             
     def delete_entries(self, entry_ids: List[str]):
         """Delete multiple history entries."""
         with self._lock:
             id_set = set(entry_ids)
             self.entries = [e for e in self.entries if e.id not in id_set]
-            self._save()
+            self._schedule_save()
             
     def clear_all(self):
         """Clear all history."""
         with self._lock:
             self.entries = []
-            self._save()
+            self._schedule_save()
 
 
 # Global history manager instance
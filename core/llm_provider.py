@@ -11,6 +11,14 @@ import urllib.request
 import urllib.error
 from .logger import get_logger
 
+COST_UNITS_PER_USD = 10 ** 12  # Cost accounting unit: pico-USD
+
+
+def _price_units(price_per_million: float) -> int:
+    """Convert a USD price per 1M tokens to integer cost units per token."""
+    return round(price_per_million * 1_000_000)
+
+
 @dataclass
 class ModelInfo:
     """Information about an available model."""
@@ -22,6 +30,7 @@ class ModelInfo:
     output_token_limit: int = 0
     prompt_price: float = 0.0  # Price per 1M tokens for prompt
     completion_price: float = 0.0  # Price per 1M tokens for completion
+    cached_prompt_price: Optional[float] = None  # Price per 1M cache-hit prompt tokens (None = prompt_price)
 
     @property
     def short_name(self) -> str:
@@ -30,12 +39,22 @@ class ModelInfo:
         name = self.name.replace("models/", "")
         return name
     
-    def calculate_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+    def calculate_cost_units(self, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> int:
+        """Calculate estimated cost as an integer number of COST_UNITS_PER_USD units."""
+        # A per-1M-token USD price is exactly micro-USD per token, so one more
+        # factor of 1M gives an integer per-token price in pico-USD.
+        cached_tokens = min(cached_tokens, prompt_tokens)
+        cached_price = self.prompt_price if self.cached_prompt_price is None else self.cached_prompt_price
+        return (
+            (prompt_tokens - cached_tokens) * _price_units(self.prompt_price)
+            + cached_tokens * _price_units(cached_price)
+            + completion_tokens * _price_units(self.completion_price)
+        )
+
+    def calculate_cost(self, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> float:
         """Calculate estimated cost in USD based on token usage."""
-        # Prices are typically per 1M tokens
-        prompt_cost = (prompt_tokens / 1_000_000) * self.prompt_price
-        completion_cost = (completion_tokens / 1_000_000) * self.completion_price
-        return prompt_cost + completion_cost
+        # Cache hits are billed at the cached rate; converted to USD only once at the end
+        return self.calculate_cost_units(prompt_tokens, completion_tokens, cached_tokens) / COST_UNITS_PER_USD
 
 class PolicyViolationError(Exception):
     """Raised when the content violates the provider's policy."""
@@ -46,6 +65,32 @@ class LLMProvider(ABC):
     
     def __init__(self):
         self.logger = get_logger()
+        # Cache-hit prompt tokens reported by the most recent generate_content call
+        self.last_cached_tokens = 0
+    
+    @staticmethod
+    def _cached_tokens_from_usage(result: Dict) -> int:
+        """Read cache-hit prompt tokens from an OpenAI-style usage block."""
+        usage = result.get("usage") or {}
+        details = usage.get("prompt_tokens_details") or {}
+        try:
+            return int(details.get("cached_tokens") or 0)
+        except (ValueError, TypeError):
+            return 0
+    
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: Optional[str] = None, cache_system: bool = False) -> List[Dict]:
+        """Build OpenAI-style chat messages with the static instructions as a separate system message."""
+        if not system_prompt:
+            return [{"role": "user", "content": prompt}]
+        if cache_system:
+            system_content: Any = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+        else:
+            system_content = system_prompt
+        return [
+            {"role": "system", "content": system_content},
+            {"role": "user", "content": prompt}
+        ]
 
     @abstractmethod
     def validate_connection(self) -> tuple[bool, str]:
@@ -58,13 +103,21 @@ class LLMProvider(ABC):
         pass
 
     @abstractmethod
-    def generate_content(self, model_name: str, prompt: str) -> str:
-        """Generate content from the model."""
+    def generate_content(self, model_name: str, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """
+        Generate content from the model.
+        
+        system_prompt carries the part of the prompt that is identical across
+        requests so providers can serve it from their prompt cache.
+        """
         pass
 
 class OpenRouterProvider(LLMProvider):
     """Provider for OpenRouter API."""
     
+    # Model families that only cache prompts marked with an explicit cache_control breakpoint
+    CACHE_CONTROL_PREFIXES = ("anthropic/", "google/gemini")
+    
     def __init__(self, api_key: str):
         super().__init__()
         self.api_key = api_key
@@ -136,6 +189,11 @@ class OpenRouterProvider(LLMProvider):
                 except (ValueError, TypeError):
                     prompt_price = 0.0
                     completion_price = 0.0
+                try:
+                    cache_read = pricing.get('input_cache_read')
+                    cached_prompt_price = float(cache_read) * 1_000_000 if cache_read is not None else None
+                except (ValueError, TypeError):
+                    cached_prompt_price = None
                 
                 models.append(ModelInfo(
                     name=m.get("id"),
@@ -145,7 +203,8 @@ class OpenRouterProvider(LLMProvider):
                     input_token_limit=m.get("context_length", 0),
                     output_token_limit=m.get("top_provider", {}).get("max_completion_tokens", 0),
                     prompt_price=prompt_price,
-                    completion_price=completion_price
+                    completion_price=completion_price,
+                    cached_prompt_price=cached_prompt_price
                 ))
         except Exception as e:
             self.logger.error(f"Failed to list OpenRouter models: {e}")
@@ -153,11 +212,13 @@ class OpenRouterProvider(LLMProvider):
         # Sort by name
         return sorted(models, key=lambda x: x.name)
 
-    def generate_content(self, model_name: str, prompt: str) -> str:
+    def generate_content(self, model_name: str, prompt: str, system_prompt: Optional[str] = None) -> str:
         import time
         data = {
             "model": model_name,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": self._build_messages(
+                prompt, system_prompt, cache_system=model_name.startswith(self.CACHE_CONTROL_PREFIXES)
+            ),
             "temperature": 0.3 # Lower temperature for translation
         }
         
@@ -165,6 +226,7 @@ class OpenRouterProvider(LLMProvider):
             start_time = time.time()
             result = self._request("POST", "/chat/completions", data)
             elapsed = time.time() - start_time
+            self.last_cached_tokens = self._cached_tokens_from_usage(result)
             self.logger.info(f"OpenRouter API response time: {elapsed:.2f}s (model: {model_name})")
             
             if "choices" in result and len(result["choices"]) > 0:
@@ -236,8 +298,11 @@ class OllamaProvider(LLMProvider):
             
         return sorted(models, key=lambda x: x.name)
 
-    def generate_content(self, model_name: str, prompt: str) -> str:
+    def generate_content(self, model_name: str, prompt: str, system_prompt: Optional[str] = None) -> str:
         url = f"{self.base_url}/api/generate"
+        # Keep the model's own Modelfile system prompt; Ollama reuses the KV cache for a shared prefix
+        if system_prompt:
+            prompt = f"{system_prompt}{prompt}"
         data = {
             "model": model_name,
             "prompt": prompt,
@@ -332,11 +397,11 @@ class GroqProvider(LLMProvider):
         
         return sorted(models, key=lambda x: x.name)
 
-    def generate_content(self, model_name: str, prompt: str) -> str:
+    def generate_content(self, model_name: str, prompt: str, system_prompt: Optional[str] = None) -> str:
         import time
         data = {
             "model": model_name,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": self._build_messages(prompt, system_prompt),
             "temperature": 0.3 
         }
         
@@ -344,6 +409,7 @@ class GroqProvider(LLMProvider):
             start_time = time.time()
             result = self._request("POST", "/chat/completions", data)
             elapsed = time.time() - start_time
+            self.last_cached_tokens = self._cached_tokens_from_usage(result)
             self.logger.info(f"Groq API response time: {elapsed:.2f}s (model: {model_name})")
             
             if "choices" in result and len(result["choices"]) > 0:
@@ -41,6 +41,12 @@ class Logger:
         """
         with self._lock:
             self.callbacks.append(callback)
+    
+    def remove_callback(self, callback: Callable[[str, str, str], None]):
+        """Stop sending log updates to a callback added with add_callback."""
+        with self._lock:
+            # Rebind rather than mutate so an in-progress _emit loop is unaffected
+            self.callbacks = [cb for cb in self.callbacks if cb != callback]
             
     def _emit(self, level: str, message: str):
         """Emit log to all callbacks."""
@@ -76,14 +82,23 @@ class Logger:
     def debug(self, message: str):
         self._emit(self.LEVEL_DEBUG, message)
         
-    def save_to_file(self, filepath: str):
-        """Save log history to a file."""
+    def save_to_file(self, filepath: str) -> bool:
+        """
+        Save log history to a file.
+        
+        Returns:
+            True if the file was written
+        """
+        # Snapshot under the lock so logging isn't blocked on disk I/O
+        with self._lock:
+            content = "\n".join(self.log_history)
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                with self._lock:
-                    f.write("\n".join(self.log_history))
+            with open(filepath, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.write(content)
+            return True
         except Exception as e:
             self.error(f"Failed to save log to file: {e}")
+            return False
             
     def clear(self):
         """Clear log history."""
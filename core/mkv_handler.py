@@ -18,6 +18,10 @@ from .config_manager import get_config
 from .logger import get_logger
 
 
+# mkvmerge --gui-mode emits "#GUI#progress 42%"; console mode emits "Progress: 42%"
+_MERGE_PROGRESS_RE = re.compile(r"(?:#GUI#progress\s+|Progress:\s*)(\d{1,3})%", re.IGNORECASE)
+
+
 @dataclass
 class SubtitleTrack:
     """Represents a subtitle track in an MKV file."""
@@ -393,7 +397,10 @@ class MKVHandler:
     @staticmethod
     def _parse_merge_progress(output: str) -> Optional[int]:
         """Extract a percentage from mkvmerge GUI or console output."""
-        match = re.search(r"(?:#GUI#progress\s+|Progress:\s*)(\d{1,3})%", output, re.IGNORECASE)
+        # Most output lines carry no percentage; skip the regex for them
+        if "%" not in output:
+            return None
+        match = _MERGE_PROGRESS_RE.search(output)
         if not match:
             return None
         return max(0, min(100, int(match.group(1))))
@@ -26,6 +26,7 @@ class ModelManager:
         self.provider: Optional[LLMProvider] = None
         self.is_configured = False
         self.available_models: List[ModelInfo] = []
+        self._models_by_name: Dict[str, ModelInfo] = {}
         self.selected_model: Optional[str] = None
         self.config = get_config()
     
@@ -76,6 +77,7 @@ class ModelManager:
             # Store state
             self.is_configured = True
             self.available_models = models
+            self._index_models()
             
             # Auto-select model
             self._auto_select_model()
@@ -89,6 +91,14 @@ class ModelManager:
         except Exception as e:
             return APIValidationResult(False, f"Validation error: {str(e)}")
     
+    def _index_models(self):
+        """Index available models by full and short name (first match wins)."""
+        index: Dict[str, ModelInfo] = {}
+        for model in self.available_models:
+            index.setdefault(model.name, model)
+            index.setdefault(model.short_name, model)
+        self._models_by_name = index
+    
     def _auto_select_model(self):
         """Auto-select the best default model or use user's saved preference."""
         # First, check if user has a saved model preference in config
@@ -138,10 +148,10 @@ class ModelManager:
     def select_model(self, model_name: str) -> bool:
         """Select a model by name."""
         # Try exact match
-        for model in self.available_models:
-            if model.name == model_name or model.short_name == model_name:
-                self.selected_model = model.name
-                return True
+        model = self._models_by_name.get(model_name)
+        if model:
+            self.selected_model = model.name
+            return True
         
         # Try partial match (case-insensitive)
         for model in self.available_models:
@@ -159,12 +169,7 @@ class ModelManager:
         """Get the ModelInfo for the currently selected model."""
         if not self.selected_model:
             return None
-        
-        for model in self.available_models:
-            if model.name == self.selected_model or model.short_name == self.selected_model:
-                return model
-        
-        return None
+        return self._models_by_name.get(self.selected_model)
 
 
 # Global API manager instance
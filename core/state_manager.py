@@ -38,6 +38,7 @@ class TranslationState:
     # Token tracking
     prompt_tokens_used: int = 0
     completion_tokens_used: int = 0
+    cached_prompt_tokens_used: int = 0
     external_subtitle_path: Optional[str] = None
     
     @property
@@ -68,6 +69,7 @@ class TranslationState:
             "updated_at": self.updated_at,
             "prompt_tokens_used": self.prompt_tokens_used,
             "completion_tokens_used": self.completion_tokens_used,
+            "cached_prompt_tokens_used": self.cached_prompt_tokens_used,
             "external_subtitle_path": self.external_subtitle_path
         }
     
@@ -88,6 +90,7 @@ class TranslationState:
             updated_at=data.get("updated_at", datetime.now().isoformat()),
             prompt_tokens_used=data.get("prompt_tokens_used", 0),
             completion_tokens_used=data.get("completion_tokens_used", 0),
+            cached_prompt_tokens_used=data.get("cached_prompt_tokens_used", 0),
             external_subtitle_path=data.get("external_subtitle_path")
         )
 
@@ -98,9 +101,14 @@ class StateManager:
     """
     Manages translation state persistence.
     Saves progress to allow pause/resume and recovery from crashes.
+    
+    The state file is JSON lines: a full snapshot record followed by one
+    progress record per update, so saving a batch appends instead of
+    rewriting every completed translation.
     """
     
-    STATE_FILENAME = "translation_state.json"
+    STATE_FILENAME = "translation_state.jsonl"
+    LEGACY_STATE_FILENAME = "translation_state.json"
     
     def __init__(self, state_dir: Optional[str] = None):
         """
@@ -118,7 +126,9 @@ class StateManager:
             self.state_dir = Path(__file__).parent.parent
         
         self.state_file = self.state_dir / self.STATE_FILENAME
+        self.legacy_state_file = self.state_dir / self.LEGACY_STATE_FILENAME
         self.current_state: Optional[TranslationState] = None
+        self._log = None  # Append handle for progress records, opened on first update
     
     @staticmethod
     def calculate_file_hash(file_path: str, size: int = 1024 * 1024) -> str:
@@ -189,7 +199,8 @@ class StateManager:
         new_translations: List[Tuple[int, str]],
         batch_index: int,
         prompt_tokens: int = 0,
-        completion_tokens: int = 0
+        completion_tokens: int = 0,
+        cached_tokens: int = 0
     ):
         """
         Update state with new translation progress.
@@ -199,6 +210,7 @@ class StateManager:
             batch_index: Current batch index
             prompt_tokens: Tokens used in this update
             completion_tokens: Completion tokens used
+            cached_tokens: Prompt tokens served from the provider cache
         """
         with self._lock:
             if not self.current_state:
@@ -206,29 +218,99 @@ class StateManager:
             
             # Add new translations
             existing_indices = {t[0] for t in self.current_state.completed_translations}
+            added = []
             for translation in new_translations:
                 if translation[0] not in existing_indices:
                     self.current_state.completed_translations.append(translation)
+                    added.append(translation)
             
             self.current_state.current_batch_index = batch_index
             self.current_state.updated_at = datetime.now().isoformat()
             self.current_state.prompt_tokens_used += prompt_tokens
             self.current_state.completion_tokens_used += completion_tokens
+            self.current_state.cached_prompt_tokens_used += cached_tokens
             
-            self.save()
+            self._append_record({
+                "type": "progress",
+                "translations": added,
+                "batch_index": batch_index,
+                "updated_at": self.current_state.updated_at,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "cached_tokens": cached_tokens
+            })
     
     def save(self):
-        """Save current state to file."""
+        """Write a compact snapshot of the current state, replacing the file atomically."""
         with self._lock:
             if not self.current_state:
                 return
             
+            self._close_log()
+            tmp_file = self.state_file.with_suffix(".tmp")
             try:
-                with open(self.state_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.current_state.to_dict(), f, indent=2, ensure_ascii=False)
+                record = {"type": "state", **self.current_state.to_dict()}
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                os.replace(tmp_file, self.state_file)
             except Exception as e:
                 print(f"Warning: Failed to save state: {e}")
     
+    def _append_record(self, record: Dict[str, Any]):
+        """Append one progress record to the state log."""
+        try:
+            if self._log is None:
+                self._log = open(self.state_file, 'a', encoding='utf-8')
+            self._log.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._log.flush()
+        except Exception as e:
+            print(f"Warning: Failed to save state: {e}")
+    
+    def _close_log(self):
+        """Flush and close the append handle, if open."""
+        if self._log is not None:
+            try:
+                self._log.close()
+            except Exception:
+                pass
+            self._log = None
+    
+    def close(self):
+        """Flush pending progress records to disk (call before exit)."""
+        with self._lock:
+            if self._log is not None:
+                try:
+                    self._log.flush()
+                    os.fsync(self._log.fileno())
+                except (OSError, ValueError):
+                    pass
+            self._close_log()
+    
+    def _read_state_file(self) -> Tuple[Optional[TranslationState], bool]:
+        """
+        Replay the snapshot and progress records from the state log.
+        
+        Returns:
+            Tuple of (state, torn) where torn means a partial trailing record was dropped
+        """
+        state = None
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    return state, True  # Torn final write; everything before it is intact
+                if record.get("type") == "state":
+                    state = TranslationState.from_dict(record)
+                elif state is not None and record.get("type") == "progress":
+                    state.completed_translations.extend(tuple(t) for t in record["translations"])
+                    state.current_batch_index = record["batch_index"]
+                    state.updated_at = record.get("updated_at", state.updated_at)
+                    state.prompt_tokens_used += record.get("prompt_tokens", 0)
+                    state.completion_tokens_used += record.get("completion_tokens", 0)
+                    state.cached_prompt_tokens_used += record.get("cached_tokens", 0)
+        return state, False
+    
     def load(self) -> Optional[TranslationState]:
         """
         Load state from file.
@@ -236,17 +318,27 @@ class StateManager:
         Returns:
             TranslationState if found, None otherwise
         """
-        if not self.state_file.exists():
-            return None
-        
-        try:
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.current_state = TranslationState.from_dict(data)
-                return self.current_state
-        except Exception as e:
-            print(f"Warning: Failed to load state: {e}")
-            return None
+        with self._lock:
+            try:
+                if self.state_file.exists():
+                    state, torn = self._read_state_file()
+                    self.current_state = state
+                    if torn and state:
+                        self.save()  # Rewrite so later appends don't follow the partial line
+                    return self.current_state
+                elif self.legacy_state_file.exists():
+                    with open(self.legacy_state_file, 'r', encoding='utf-8') as f:
+                        self.current_state = TranslationState.from_dict(json.load(f))
+                    # Migrate: the log must open with a snapshot or later appends are unreadable
+                    self.save()
+                    if self.state_file.exists():
+                        os.remove(self.legacy_state_file)
+                    return self.current_state
+                else:
+                    return None
+            except Exception as e:
+                print(f"Warning: Failed to load state: {e}")
+                return None
     
     def has_resumable_state(self, source_file: Optional[str] = None) -> bool:
         """
@@ -313,12 +405,15 @@ class StateManager:
     
     def clear(self):
         """Clear the saved state (call after successful completion)."""
-        self.current_state = None
-        if self.state_file.exists():
-            try:
-                os.remove(self.state_file)
-            except Exception as e:
-                print(f"Warning: Failed to clear state: {e}")
+        with self._lock:
+            self.current_state = None
+            self._close_log()
+            for path in (self.state_file, self.legacy_state_file):
+                if path.exists():
+                    try:
+                        os.remove(path)
+                    except Exception as e:
+                        print(f"Warning: Failed to clear state: {e}")
     
     def get_completed_indices(self) -> set:
         """Get set of already completed line indices."""
@@ -28,6 +28,11 @@ class StyleHandler:
     # Tags that indicate complex positioning (usually signs)
     POSITIONING_TAGS = [r'\\pos\(', r'\\move\(', r'\\org\(', r'\\clip\(']
     
+    # Compiled once; extract_styles runs for every subtitle line
+    _POSITIONING_RE = re.compile('|'.join(POSITIONING_TAGS))
+    _PREFIX_TAGS_RE = re.compile(r'^(\{[^}]*\})+')
+    _INLINE_TAG_RE = re.compile(r'\{\\[^}]+\}')
+    
     def __init__(self):
         self.placeholder_pattern = "<<STYLE_{}>>"
         
@@ -62,11 +67,20 @@ class StyleHandler:
         Returns:
             StyleInfo object with separated tags and clean text
         """
-        # Check for complex styling
-        has_complex = any(re.search(pattern, text) for pattern in self.POSITIONING_TAGS)
+        # Check for complex styling; every positioning tag starts with a backslash
+        has_complex = "\\" in text and self._POSITIONING_RE.search(text) is not None
+        
+        # Without an override block there are no tags to separate
+        if "{" not in text:
+            return StyleInfo(
+                prefix_tags="",
+                clean_text=text,
+                inline_tags=[],
+                has_complex_styling=has_complex
+            )
         
         # Extract all tags at the beginning of the line
-        prefix_match = re.match(r'^(\{[^}]*\})+', text)
+        prefix_match = self._PREFIX_TAGS_RE.match(text)
         prefix_tags = prefix_match.group(0) if prefix_match else ""
         
         # Remove prefix tags to get remaining text
@@ -76,16 +90,16 @@ class StyleHandler:
         inline_tags = []
         clean_text_parts = []
         last_pos = 0
+        current_clean_pos = 0
         
-        # Pattern to match inline tags like {\i1}, {\b1}, etc.
-        inline_pattern = r'\{\\[^}]+\}'
-        
-        for match in re.finditer(inline_pattern, remaining_text):
+        # Match inline tags like {\i1}, {\b1}, etc.
+        for match in self._INLINE_TAG_RE.finditer(remaining_text):
             # Add text before this tag
-            clean_text_parts.append(remaining_text[last_pos:match.start()])
+            segment = remaining_text[last_pos:match.start()]
+            clean_text_parts.append(segment)
             
             # Store tag with its position in clean text
-            current_clean_pos = len(''.join(clean_text_parts))
+            current_clean_pos += len(segment)
             inline_tags.append((current_clean_pos, match.group(0)))
             
             last_pos = match.end()
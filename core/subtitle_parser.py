@@ -4,10 +4,15 @@ Handles parsing and writing of SRT/ASS subtitle files using pysubs2.
 """
 
 import pysubs2
+import re
 from pathlib import Path
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 
+# Styling removed by SubtitleLine.clean_text
+_ASS_TAG_RE = re.compile(r'\{\\[^}]+\}')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 
 @dataclass
 class SubtitleLine:
@@ -45,11 +50,13 @@ class SubtitleLine:
     
     def clean_text(self) -> str:
         """Get text with formatting tags removed (for translation)."""
-        import re
         # Remove ASS styling tags like {\\i1}, {\\b1}, etc.
-        text = re.sub(r'\{\\[^}]+\}', '', self.text)
+        text = self.text
+        if '{' in text:
+            text = _ASS_TAG_RE.sub('', text)
         # Remove HTML-like tags
-        text = re.sub(r'<[^>]+>', '', text)
+        if '<' in text:
+            text = _HTML_TAG_RE.sub('', text)
         return text.strip()
 
 
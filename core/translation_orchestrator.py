@@ -4,6 +4,7 @@ Manages the lifecycle of a subtitle translation process (run, pause, resume, can
 """
 
 import time
+import queue
 import threading
 from pathlib import Path
 from typing import Callable, Optional, Dict, Any
@@ -17,6 +18,9 @@ from .logger import get_logger
 
 logger = get_logger()
 
+# Characters that are illegal in Windows file names, mapped in a single str.translate pass
+_FN_SANITIZE = str.maketrans({c: "_" for c in '/\\:*?"<>|'})
+
 class TranslationOrchestrator:
     """Manages the lifecycle of the translation process in the background."""
     
@@ -32,6 +36,16 @@ class TranslationOrchestrator:
         
         self.token_usage = TokenUsage()
         
+        # Single long-lived worker; start/resume enqueue jobs instead of spawning threads.
+        # _job_busy is set when a job is queued and cleared when it ends or is stopped;
+        # _job_seq tells the worker whether a newer job was queued meanwhile.
+        self._job_queue: "queue.Queue[tuple]" = queue.Queue()
+        self._job_lock = threading.Lock()
+        self._job_busy = False
+        self._job_seq = 0
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        
         # Callbacks
         self.on_progress: Optional[Callable[[int, int, str, TokenUsage], None]] = None
         self.on_complete: Optional[Callable[[Dict[str, Any]], None]] = None
@@ -57,17 +71,46 @@ class TranslationOrchestrator:
         anime_title: Optional[str] = None,
         external_subtitle_path: Optional[str] = None
     ):
-        """Start the translation process in a background thread."""
-        self.is_processing = True
-        self.is_paused = False
-        self.should_cancel = False
+        """
+        Queue the translation process on the background worker.
         
-        thread = threading.Thread(
-            target=self._run_translation_thread,
-            args=(file_path, track_id, source_lang, target_lang, model_name, anime_title, external_subtitle_path),
-            daemon=True
-        )
-        thread.start()
+        Returns:
+            False if a job is already queued or running, True otherwise
+        """
+        with self._job_lock:
+            if self._job_busy:
+                logger.warning("Translation already in progress, ignoring duplicate start")
+                return False
+            self._job_busy = True
+            self._job_seq += 1
+            
+            self.is_processing = True
+            self.is_paused = False
+            self.should_cancel = False
+            
+            self._job_queue.put((
+                self._job_seq,
+                (file_path, track_id, source_lang, target_lang, model_name, anime_title, external_subtitle_path)
+            ))
+        return True
+    
+    def _worker_loop(self):
+        """Run queued translation jobs one at a time."""
+        while True:
+            job_seq, job = self._job_queue.get()
+            try:
+                self._run_translation_thread(*job)
+            except KeyboardInterrupt:
+                pass  # Raised by the progress callback when the user stops the run
+            except Exception as e:
+                logger.error(f"Translation worker error: {e}")
+            finally:
+                with self._job_lock:
+                    # A stopped job must not clear the state of one queued after it
+                    if job_seq == self._job_seq:
+                        self._job_busy = False
+                        self.is_processing = False
+                self._job_queue.task_done()
         
     def _run_translation_thread(
         self,
@@ -151,6 +194,10 @@ class TranslationOrchestrator:
                 anime_title=anime_title
             )
             
+            # Stopped by pause/cancel; completed lines are already in the state file
+            if translator.should_stop:
+                return
+            
             # Apply translations
             parser.apply_translations(translations)
             
@@ -158,7 +205,7 @@ class TranslationOrchestrator:
             input_path = Path(file_path)
             output_dir = self.config.default_output_dir or str(input_path.parent)
             
-            sanitized_model = model_name.replace("/", "_").replace(":", "_").replace("\\", "_")
+            sanitized_model = model_name.translate(_FN_SANITIZE)
             ext = Path(extracted_path).suffix
             initial_path = Path(output_dir) / f"{input_path.stem}_{sanitized_model}_translated{ext}"
             
@@ -167,6 +214,10 @@ class TranslationOrchestrator:
             # Construct Payload
             payload = {
                 "current_file": file_path,
+                "track_id": track_id,
+                "source_lang": source_lang,
+                "total_lines": total_lines,
+                "provider": self.config.provider,
                 "translated_sub_path": str(translated_sub_path),
                 "output_dir": output_dir,
                 "input_path": input_path,
@@ -193,25 +244,30 @@ class TranslationOrchestrator:
                 self.on_error(str(e))
         finally:
             self.active_translator = None
-            self.is_processing = False
             
     def pause(self):
         """Pause the translation."""
         self.is_paused = True
         self.should_cancel = True
+        with self._job_lock:
+            self._job_busy = False  # The stopping job no longer blocks a new start
         if self.active_translator:
+            # End the current job; resume queues a new one from the saved state
             self.active_translator.is_paused = True
+            self.active_translator.should_stop = True
             
     def resume(self):
-        """Resume from paused state (requires calling start_translation again after this or handling it via threading loop logic)."""
-        # The logic in app.py restarts the thread, so resume here just clears flags.
+        """Resume from paused state (requires calling start_translation again after this)."""
+        # The logic in app.py queues a new job, so resume here just clears flags.
         self.is_paused = False
         self.should_cancel = False
         
     def cancel(self):
         """Cancel translation."""
         self.should_cancel = True
-        self.is_processing = False
+        with self._job_lock:
+            self._job_busy = False
+            self.is_processing = False
         if self.active_translator:
             self.active_translator.should_stop = True
             self.active_translator = None
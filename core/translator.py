@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 import threading
 import time
 import re
+import string
 
 from .subtitle_parser import SubtitleLine
 from .logger import get_logger
@@ -20,6 +21,9 @@ from .prompt_manager import PromptManager
 # Generic type for return values
 T = TypeVar('T')
 
+# One "[NUMBER] text" entry of a batch response; text runs until the next entry
+_RESPONSE_ENTRY_RE = re.compile(r'\[(\d+)\]\s*(.+?)(?=\n\[\d+\]|\Z)', re.DOTALL)
+
 
 @dataclass
 class TokenUsage:
@@ -27,13 +31,15 @@ class TokenUsage:
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    cached_prompt_tokens: int = 0  # Subset of prompt_tokens served from the provider's prompt cache
     _lock: threading.Lock = field(default_factory=threading.Lock)
     
-    def add(self, prompt: int = 0, completion: int = 0):
+    def add(self, prompt: int = 0, completion: int = 0, cached: int = 0):
         """Add tokens to the usage."""
         with self._lock:
             self.prompt_tokens += prompt
             self.completion_tokens += completion
+            self.cached_prompt_tokens += cached
             self.total_tokens = self.prompt_tokens + self.completion_tokens
     
     def reset(self):
@@ -41,6 +47,7 @@ class TokenUsage:
         with self._lock:
             self.prompt_tokens = 0
             self.completion_tokens = 0
+            self.cached_prompt_tokens = 0
             self.total_tokens = 0
     
     def __str__(self) -> str:
@@ -174,17 +181,23 @@ class Translator:
         lines_text = "\n".join(lines_text_parts)
         
         # Build prompt - get from PromptManager
-        prompt_template = self.prompt_manager.get_active_prompt()
-        prompt = prompt_template.format(
-            source_lang=source_lang,
-            target_lang=target_lang,
-            context=context,
-            lines=lines_text
+        # The static instructions are sent separately so providers can cache them across batches
+        prompt_values = {
+            "source_lang": source_lang,
+            "target_lang": target_lang,
+            "context": context,
+            "lines": lines_text
+        }
+        static_template, dynamic_template = self._split_prompt_template(
+            self.prompt_manager.get_active_prompt()
         )
+        system_prompt = static_template.format(**prompt_values) or None
+        prompt = dynamic_template.format(**prompt_values)
+        prompt_chars = len(prompt) + len(system_prompt or "")
         
         # Estimate prompt tokens (rough estimate: ~4 chars per token)
-        estimated_prompt_tokens = len(prompt) // 4
-        self.logger.info(f"📝 Prompt size: {len(prompt)} chars (~{estimated_prompt_tokens} tokens)")
+        estimated_prompt_tokens = prompt_chars // 4
+        self.logger.info(f"📝 Prompt size: {prompt_chars} chars (~{estimated_prompt_tokens} tokens)")
         
         def do_translation():
             """Inner function to execute translation."""
@@ -194,7 +207,8 @@ class Translator:
             self.logger.info(f"🌐 Calling API: {self.current_model_name}")
             response_text = self.model_manager.provider.generate_content(
                 self.current_model_name,
-                prompt
+                prompt,
+                system_prompt=system_prompt
             )
             
             if not response_text:
@@ -224,13 +238,16 @@ class Translator:
             
             # Track tokens
             estimated_completion_tokens = len(response_text) // 4
+            cached_tokens = self.model_manager.provider.last_cached_tokens
             batch_tokens.add(
                 prompt=estimated_prompt_tokens,
-                completion=estimated_completion_tokens
+                completion=estimated_completion_tokens,
+                cached=cached_tokens
             )
             self.token_usage.add(
                 prompt=estimated_prompt_tokens,
-                completion=estimated_completion_tokens
+                completion=estimated_completion_tokens,
+                cached=cached_tokens
             )
             
             self.logger.info(f"✅ API response received: {len(response_text)} chars (~{estimated_completion_tokens} tokens) in {api_elapsed:.2f}s")
@@ -300,20 +317,24 @@ class Translator:
                     
                     response_text = self.model_manager.provider.generate_content(
                         fallback_model,
-                        prompt
+                        prompt,
+                        system_prompt=system_prompt
                     )
                     
                     fallback_elapsed = time.time() - fallback_start
                     
                     # Track tokens (approx info)
                     estimated_completion_tokens = len(response_text) // 4
+                    cached_tokens = self.model_manager.provider.last_cached_tokens
                     batch_tokens.add(
                         prompt=estimated_prompt_tokens,
-                        completion=estimated_completion_tokens
+                        completion=estimated_completion_tokens,
+                        cached=cached_tokens
                     )
                     self.token_usage.add(
                         prompt=estimated_prompt_tokens,
-                        completion=estimated_completion_tokens
+                        completion=estimated_completion_tokens,
+                        cached=cached_tokens
                     )
                     
                     self.logger.info(f"✅ Fallback response received: {len(response_text)} chars in {fallback_elapsed:.2f}s")
@@ -365,6 +386,48 @@ class Translator:
                 tokens_used=batch_tokens
             )
     
+    @staticmethod
+    def _split_prompt_template(template: str) -> Tuple[str, str]:
+        """
+        Split a prompt template into its static prefix and per-batch remainder.
+        
+        The prefix ends where the first per-batch placeholder ({context} or {lines})
+        begins, so it renders identically for every batch of a job. Escaped braces
+        such as {{context}} are literal text, not placeholders. A template that
+        cannot be parsed is returned whole as the remainder.
+        """
+        try:
+            parsed = list(string.Formatter().parse(template))
+        except ValueError:
+            return "", template
+        
+        # Rebuild the template piece by piece (re-escaping literal braces) so both
+        # halves format exactly like the whole template would
+        static_parts = []
+        for i, (literal, field_name, format_spec, conversion) in enumerate(parsed):
+            static_parts.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field_name in ("context", "lines"):
+                dynamic_parts = []
+                for literal, field_name, format_spec, conversion in parsed[i:]:
+                    if dynamic_parts:
+                        dynamic_parts.append(literal.replace("{", "{{").replace("}", "}}"))
+                    dynamic_parts.append(Translator._format_field(field_name, format_spec, conversion))
+                return "".join(static_parts), "".join(dynamic_parts)
+            static_parts.append(Translator._format_field(field_name, format_spec, conversion))
+        return "", template
+    
+    @staticmethod
+    def _format_field(field_name: Optional[str], format_spec: str, conversion: Optional[str]) -> str:
+        """Re-create the replacement field text for one Formatter.parse() item."""
+        if field_name is None:
+            return ""
+        field = "{" + field_name
+        if conversion:
+            field += "!" + conversion
+        if format_spec:
+            field += ":" + format_spec
+        return field + "}"
+    
     def _parse_response(
         self, 
         response_text: str, 
@@ -373,22 +436,14 @@ class Translator:
         """Parse the API response to extract translations."""
         results = []
         
-        # Pattern to match [NUMBER] text
-        pattern = r'\[(\d+)\]\s*(.+?)(?=\n\[\d+\]|\Z)'
-        matches = re.findall(pattern, response_text, re.DOTALL)
-        
         # Create a mapping of expected indices
         expected_indices = {line.index for line in original_lines}
         
-        for match in matches:
-            try:
-                index = int(match[0])
-                text = match[1].strip()
-                
-                if index in expected_indices:
-                    results.append((index, text))
-            except (ValueError, IndexError):
-                continue
+        # Single scan over the response; group 1 is always a digit run
+        for match in _RESPONSE_ENTRY_RE.finditer(response_text):
+            index = int(match.group(1))
+            if index in expected_indices:
+                results.append((index, match.group(2).strip()))
         
         return results
 
@@ -442,6 +497,7 @@ class Translator:
                 recovery_tokens.add(
                     prompt=result.tokens_used.prompt_tokens,
                     completion=result.tokens_used.completion_tokens,
+                    cached=result.tokens_used.cached_prompt_tokens,
                 )
 
                 returned = {index: text for index, text in result.translated_lines}
@@ -500,6 +556,7 @@ class Translator:
             if state_manager.current_state:
                 self.token_usage.prompt_tokens = state_manager.current_state.prompt_tokens_used
                 self.token_usage.completion_tokens = state_manager.current_state.completion_tokens_used
+                self.token_usage.cached_prompt_tokens = state_manager.current_state.cached_prompt_tokens_used
                 self.token_usage.total_tokens = self.token_usage.prompt_tokens + self.token_usage.completion_tokens
             
             if completed_indices:
@@ -570,6 +627,7 @@ class Translator:
                     batch_index=batch_idx,
                     prompt_tokens=batch_tokens.prompt_tokens,
                     completion_tokens=batch_tokens.completion_tokens,
+                    cached_tokens=batch_tokens.cached_prompt_tokens,
                 )
 
             context_lines = batch[-3:] if len(batch) >= 3 else batch
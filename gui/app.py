@@ -11,11 +11,10 @@ from typing import Optional, List
 import threading
 import os
 import time
-import sys
 import ctypes
 
-from .constants import APP_TITLE, APP_VERSION, WINDOW_SIZE, MIN_SIZE, LANGUAGE_MAPPING
-from .window_utils import setup_window_style
+from .constants import APP_TITLE, APP_VERSION, WINDOW_SIZE, MIN_SIZE, FOOTER_HEIGHT, LANGUAGE_MAPPING
+from .window_utils import setup_window_style, open_folder
 
 from .styles import (
     COLORS, FONTS, SPACING, RADIUS,
@@ -26,23 +25,21 @@ from .components import (
     LogPanel, CollapsibleFrame, CustomTitleBar, VerticalStepper, HorizontalStepper,
     ContentProgressHeader
 )
-from .settings_dialog import SettingsDialog
 from core.prompt_manager import PromptManager
 from .toast import ToastManager
 from .processing_view import ProcessingView
-from .history_view import HistoryView
 from .views.file_selection_view import FileSelectionView
 from .views.configuration_view import ConfigurationView
 from .views.footer_view import FooterView
 from .views.review_view import ReviewView
 
-from core.config_manager import get_config, ConfigManager
-from core.mkv_handler import MKVHandler, SubtitleTrack
+from core.config_manager import get_config
+from core.mkv_handler import MKVHandler
 from core.subtitle_parser import SubtitleParser
-from core.translator import Translator, get_api_manager, TokenUsage
-from core.state_manager import get_state_manager, StateManager
-from core.history_manager import get_history_manager, HistoryEntry
-from core.logger import get_logger, Logger
+from core.translator import get_api_manager
+from core.state_manager import get_state_manager
+from core.history_manager import get_history_manager
+from core.logger import get_logger
 from core.utils import extract_anime_title
 from core.finalization_service import FinalizationService
 
@@ -91,8 +88,9 @@ class SubAutoApp(ctk.CTk):
         self.app_state = AppState()
         self.config = get_config()
         self.prompt_manager = PromptManager()
-        self.settings_view: Optional[SettingsDialog] = None
-        self.history_view: Optional[HistoryView] = None
+        self.settings_view = None
+        self.history_view = None
+        self.summary_view: Optional[SummaryWindow] = None
         self.mkv_handler: Optional[MKVHandler] = None
         
         self.app_state_manager = get_state_manager()
@@ -256,14 +254,20 @@ class SubAutoApp(ctk.CTk):
     
     def _create_footer(self):
         """Create footer with action buttons (FULL WIDTH)."""
+        # Fixed-height container so hiding the footer never changes root geometry
+        self._footer_container = ctk.CTkFrame(self, fg_color="transparent", height=FOOTER_HEIGHT)
+        self._footer_container.grid(row=2, column=0, sticky="ew", padx=SPACING["md"], pady=(0, SPACING["md"]))
+        self._footer_container.pack_propagate(False)
+        
         self.footer = FooterView(
-            self,
+            self._footer_container,
             on_resume=self._resume_translation,
             on_show_summary=self._show_last_summary,
             on_pause=self._pause_translation,
             on_cancel=self._cancel_translation
         )
-        self.footer.grid(row=2, column=0, sticky="ew", padx=SPACING["md"], pady=(0, SPACING["md"]))
+        self.footer.pack(fill="both", expand=True)
+        self._footer_visible = True
         
         # Link references for backward compatibility
         self.resume_btn = self.footer.resume_btn
@@ -369,6 +373,7 @@ class SubAutoApp(ctk.CTk):
             self.cost_estimate_label.configure(text=display_text)
     def _open_settings(self):
         """Open settings view."""
+        from .settings_dialog import SettingsDialog
         self.view_manager.open_settings(
             self.config,
             self._on_settings_save,
@@ -380,21 +385,30 @@ class SubAutoApp(ctk.CTk):
         """Handle active prompt change notification."""
         self.title_bar.set_active_prompt(prompt_name)
         
+    def _set_footer_visible(self, visible: bool):
+        """Show or hide the footer inside its fixed-height container."""
+        if not hasattr(self, 'footer') or self._footer_visible == visible:
+            return
+        self._footer_visible = visible
+        if visible:
+            self.footer.pack(fill="both", expand=True)
+        else:
+            self.footer.pack_forget()
+        
     def _on_overlay_opened(self, view_type: str):
         """Callback when an overlay is opened."""
-        if hasattr(self, 'footer'):
-            self.footer.grid_remove()
+        self._set_footer_visible(False)
         
         if view_type == "settings" and self.view_manager.settings_view:
             self.view_manager.settings_view.remove_subs_var.set(self.app_state.remove_old_subs)
 
     def _on_overlay_closed(self, view_type: str):
         """Callback when an overlay is closed."""
-        if hasattr(self, 'footer'):
-            self.footer.grid()
+        self._set_footer_visible(True)
 
     def _open_history(self):
         """Open history view."""
+        from .history_view import HistoryView
         self.view_manager.open_history(HistoryView)
     
     def _on_settings_save(self, settings: dict):
@@ -414,9 +428,7 @@ class SubAutoApp(ctk.CTk):
                 if self.config.provider == "ollama" or \
                    (self.config.provider == "openrouter" and self.config.openrouter_api_key) or \
                    (self.config.provider == "groq" and self.config.groq_api_key):
-                    # Show connecting status first
-                    self.app_state.is_validating = True
-                    self.title_bar.set_api_status(False, connecting=True)
+                    # validate_api shows the connecting status and guards duplicate runs
                     self._validate_api()
                 else:
                     self.toast.info("AI settings updated. Please reconnect.")
@@ -430,7 +442,7 @@ class SubAutoApp(ctk.CTk):
     
     def _on_file_selected(self, file_path: str):
         """Handle file selection."""
-        self.app_state.current_file = file_path
+        self.app_state.set_current_file(file_path)
         self.app_state.external_subtitle_path = None
         self._load_subtitle_tracks()
         self._update_step_states()
@@ -439,13 +451,13 @@ class SubAutoApp(ctk.CTk):
         self._on_step_change(2)
 
     
-    def _load_subtitle_tracks(self):
+    def _load_subtitle_tracks(self, stat_result: Optional[os.stat_result] = None):
         """Load subtitle tracks from the selected MKV file."""
         if not self.app_state.current_file or not self.mkv_handler:
             return
             
         try:
-            filtered_tracks = self.subtitle_service.load_tracks(self.app_state.current_file)
+            filtered_tracks = self.subtitle_service.load_tracks(self.app_state.current_file, stat_result)
             
             # Update View
             view = self.step_frames[1]
@@ -568,16 +580,13 @@ class SubAutoApp(ctk.CTk):
         
         # Set file info in processing view
         if self.app_state.current_file:
-            filename = Path(self.app_state.current_file).name
-            track_info = ""
-            for track in self.app_state.subtitle_tracks:
-                if track.track_id == self.app_state.selected_track_id:
-                    track_info = f"Track {track.track_id} - {track.language.upper()}"
-                    break
             if self.app_state.external_subtitle_path:
                 track_info = f"External - {Path(self.app_state.external_subtitle_path).name}"
+            else:
+                track = self.app_state.tracks_by_id.get(self.app_state.selected_track_id)
+                track_info = f"Track {track.track_id} - {track.language.upper()}" if track else ""
             
-            self.processing_view.set_file_info(filename, track_info)
+            self.processing_view.set_file_info(self.app_state.current_file_name, track_info)
     
     def _exit_processing_mode(self):
         """Return to normal mode or advance to review."""
@@ -668,7 +677,7 @@ class SubAutoApp(ctk.CTk):
             if self.translation_session.pause():
                 self.processing_view.set_paused(True)
                 self.footer.set_processing_mode(True, is_paused=True)
-                self.status_label.configure(text="Paused - progress saved")
+                self.footer.set_status("Paused - progress saved")
     
     def _resume_translation(self):
         """Resume from saved state."""
@@ -682,6 +691,9 @@ class SubAutoApp(ctk.CTk):
     
     def _do_resume(self):
         """Actually resume translation."""
+        # Ignore repeated clicks while a resumed run is already active
+        if self.app_state.is_processing and not self.app_state.is_paused:
+            return
         self._pending_resume = False
         self.app_state.is_paused = False
         self.app_state.should_cancel = False
@@ -731,25 +743,39 @@ class SubAutoApp(ctk.CTk):
     def _on_translation_summary_ready(self, summary_data: dict):
         """Callback from translation controller when summary is ready for UI."""
         self.progress_header.set_step(5)
-        self.summary_view = SummaryWindow(
-            self,
-            **summary_data,
-            on_open_folder=lambda: os.startfile(Path(summary_data["output_path"]).parent) if summary_data.get("output_path") else None,
-            on_close=self._close_summary
-        )
-        self.summary_view.grid(row=1, column=0, rowspan=2, sticky="nsew")
-        self.summary_view.lift()
+        self._show_summary(summary_data)
         
         if self.app_state_manager:
             self.app_state_manager.clear()
             
         self.after(2000, self._exit_processing_mode)
     
+    def _show_summary(self, summary_data: dict):
+        """Show the summary overlay, reusing the hidden view when one exists."""
+        output_path = summary_data.get("output_path")
+        if output_path:
+            output_dir = str(Path(output_path).parent)
+            on_open_folder = lambda p=output_dir: open_folder(p)
+        else:
+            on_open_folder = None
+        
+        if self.summary_view:
+            self.summary_view.update_data(**summary_data, on_open_folder=on_open_folder)
+            self.summary_view.grid()
+        else:
+            self.summary_view = SummaryWindow(
+                self,
+                **summary_data,
+                on_open_folder=on_open_folder,
+                on_close=self._close_summary
+            )
+            self.summary_view.grid(row=1, column=0, rowspan=2, sticky="nsew")
+        self.summary_view.lift()
+    
     def _close_summary(self):
         """Close summary view and reset app for next file."""
-        if hasattr(self, 'summary_view') and self.summary_view:
-            self.summary_view.destroy()
-            self.summary_view = None
+        if self.summary_view:
+            self.summary_view.grid_remove()
             
         self._reset_app()
 
@@ -828,7 +854,9 @@ class SubAutoApp(ctk.CTk):
         if not state:
             return
         
-        if not os.path.exists(state.source_file):
+        try:
+            source_stat = os.stat(state.source_file)
+        except OSError:
             self.app_state_manager.clear()
             return
         
@@ -839,10 +867,10 @@ class SubAutoApp(ctk.CTk):
             f"Progress: {state.progress_percent:.1f}%\n"
             "Resume?"
         ):
-            self.app_state.current_file = state.source_file
+            self.app_state.set_current_file(state.source_file)
             self.app_state.external_subtitle_path = state.external_subtitle_path
-            self.file_drop.set_file(state.source_file)
-            self._load_subtitle_tracks()
+            self.file_drop.set_file(state.source_file, source_stat)
+            self._load_subtitle_tracks(source_stat)
             
             if state.external_subtitle_path and os.path.exists(state.external_subtitle_path):
                 self.app_state.selected_track_id = -1
@@ -851,7 +879,8 @@ class SubAutoApp(ctk.CTk):
                 )
                 self._update_step_states()
             elif state.track_id is not None:
-                self.after(500, lambda: self._select_track_by_id(state.track_id))
+                # Track items are built synchronously by _load_subtitle_tracks
+                self._select_track_by_id(state.track_id)
             
             self.source_lang_row.set_value(state.source_lang)
             self.target_lang_row.set_value(state.target_lang)
@@ -861,27 +890,25 @@ class SubAutoApp(ctk.CTk):
             if hasattr(self, 'start_btn'):
                 self.start_btn.pack_forget()
             self.resume_btn.pack(side="left")
-            self.status_label.configure(text="Ready to resume")
+            self.footer.set_status("Ready to resume")
         else:
             self.app_state_manager.clear()
     
     def _select_track_by_id(self, track_id: int):
         """Select track by ID."""
-        for item in self.track_items:
-            if item.track_id == track_id:
-                item.select()
-                self.app_state.selected_track_id = track_id
-                self._update_step_states()
-                break
+        item = self.step_frames[1].get_track_item(track_id)
+        if item:
+            item.select()
+            self.app_state.selected_track_id = track_id
+            self._update_step_states()
     
     def _reset_app(self):
         """Reset app to initial state."""
-        self.app_state.current_file = None
+        self.app_state.set_current_file(None)
+        self.app_state.tracks_by_id.clear()
         self.file_drop.reset()
         
-        for item in self.track_items:
-            item.destroy()
-        self.track_items.clear()
+        self.step_frames[1].release_tracks()
         self.app_state.selected_track_id = None
         self.app_state.external_subtitle_path = None
         self.step_frames[1].show_external_subtitle_option(False)
@@ -896,7 +923,7 @@ class SubAutoApp(ctk.CTk):
         
         self._on_step_change(1) # Go back to step 1
         self._update_step_states()
-        self.status_label.configure(text="")
+        self.footer.set_status("")
         
         self.resume_btn.pack_forget()
         if hasattr(self, 'start_btn'):
@@ -905,20 +932,7 @@ class SubAutoApp(ctk.CTk):
     def _show_last_summary(self):
         """Re-open the last summary window."""
         if self.app_state.last_summary_data:
-            from pathlib import Path
-            output_path = Path(self.app_state.last_summary_data["output_path"])
-            
-            if hasattr(self, 'summary_view') and self.summary_view:
-                self.summary_view.destroy()
-            
-            self.summary_view = SummaryWindow(
-                self,
-                **self.app_state.last_summary_data,
-                on_open_folder=lambda: os.startfile(output_path.parent),
-                on_close=self._close_summary
-            )
-            self.summary_view.grid(row=1, column=0, rowspan=2, sticky="nsew")
-            self.summary_view.lift()
+            self._show_summary(self.app_state.last_summary_data)
 
     def _on_close(self):
         """Handle window close."""
@@ -927,9 +941,11 @@ class SubAutoApp(ctk.CTk):
                 return
         
         self.app_state.should_cancel = True
+        self.history_manager.flush()
+        self.app_state_manager.close()
+        # Let mainloop() return normally; remaining worker threads are daemons
         self.quit()
         self.destroy()
-        sys.exit(0)
 
 def run_app():
     """Run the Sub-auto application."""
@@ -1,8 +1,13 @@
 import customtkinter as ctk
-from typing import Optional, Callable, List
+import queue
+import threading
+from typing import Optional, Callable, List, Dict
+from core.translator import get_api_manager
+from .base import StatusBadge
 from .styles import (
     COLORS, FONTS, SPACING, RADIUS,
-    get_button_style, get_input_style, get_label_style
+    get_button_style, get_input_style, get_label_style, get_frame_style,
+    get_dropdown_style
 )
 
 class ModelSelectorDialog(ctk.CTkToplevel):
@@ -10,6 +15,8 @@ class ModelSelectorDialog(ctk.CTkToplevel):
     Searchable, scrollable model selector dialog.
     """
     
+    SEARCH_DEBOUNCE_MS = 150  # Keystrokes within this window trigger one re-filter
+    
     def __init__(
         self,
         parent,
@@ -21,9 +28,16 @@ class ModelSelectorDialog(ctk.CTkToplevel):
         super().__init__(parent)
         
         self.models = models
+        self._models_lower = [m.lower() for m in models]  # Search keys, built once
         self.filtered_models = models
         self.on_select_callback = on_select
         self.current_model = current_model
+        # Model buttons are recycled across searches; _button_models[i] is the
+        # model pool button i currently shows, and the first _shown_count are packed
+        self._model_buttons: List[ctk.CTkButton] = []
+        self._button_models: List[str] = []
+        self._shown_count = 0
+        self._search_after_id = None
         
         # Window setup
         self.title(title)
@@ -81,6 +95,8 @@ class ModelSelectorDialog(ctk.CTkToplevel):
         self.list_frame.grid(row=1, column=0, sticky="nsew", padx=SPACING["sm"], pady=(0, SPACING["md"]))
         self.list_frame.grid_columnconfigure(0, weight=1)
         
+        self.empty_label = ctk.CTkLabel(self.list_frame, text="No models found", **get_label_style("muted"))
+        
         self._populate_list(self.models)
         
         # Close button
@@ -93,35 +109,55 @@ class ModelSelectorDialog(ctk.CTkToplevel):
         close_btn.grid(row=2, column=0, pady=(0, SPACING["md"]))
         
     def _populate_list(self, models: List[str]):
-        """Populate the list with model buttons."""
-        # Clear existing
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
-            
-        if not models:
-            lbl = ctk.CTkLabel(self.list_frame, text="No models found", **get_label_style("muted"))
-            lbl.pack(pady=SPACING["md"])
-            return
+        """Populate the list with model buttons, reusing buttons from earlier renders."""
+        pool = self._model_buttons
+        for index, model in enumerate(models):
+            if index == len(pool):
+                pool.append(ctk.CTkButton(
+                    self.list_frame,
+                    text="",
+                    anchor="w",
+                    text_color=COLORS["text_primary"],
+                    height=35
+                ))
+                self._button_models.append("")
             
-        for model in models:
-            is_selected = model == self.current_model
+            if self._button_models[index] != model:
+                is_selected = model == self.current_model
+                pool[index].configure(
+                    text=model,
+                    fg_color=COLORS["accent_bg"] if is_selected else COLORS["bg_light"],
+                    hover_color=COLORS["border_light"] if is_selected else COLORS["border"],
+                    command=lambda m=model: self._on_select(m)
+                )
+                self._button_models[index] = model
             
-            btn = ctk.CTkButton(
-                self.list_frame,
-                text=model,
-                anchor="w",
-                fg_color=COLORS["accent_bg"] if is_selected else COLORS["bg_light"],
-                text_color=COLORS["text_primary"],
-                hover_color=COLORS["border_light"] if is_selected else COLORS["border"],
-                height=35,
-                command=lambda m=model: self._on_select(m)
-            )
-            btn.pack(fill="x", pady=2, padx=2)
+            # Buttons are packed in pool order, so newly shown ones append at the end
+            if index >= self._shown_count:
+                pool[index].pack(fill="x", pady=2, padx=2)
+        
+        for btn in pool[len(models):self._shown_count]:
+            btn.pack_forget()
+        self._shown_count = len(models)
+        
+        if models:
+            self.empty_label.pack_forget()
+        else:
+            self.empty_label.pack(pady=SPACING["md"])
             
     def _on_search(self, event):
+        """Schedule filtering once typing pauses."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.SEARCH_DEBOUNCE_MS, self._apply_search)
+    
+    def _apply_search(self):
         """Filter models based on search text."""
+        self._search_after_id = None
         query = self.search_entry.get().lower()
-        self.filtered_models = [m for m in self.models if query in m.lower()]
+        self.filtered_models = [
+            model for model, key in zip(self.models, self._models_lower) if query in key
+        ]
         self._populate_list(self.filtered_models)
         
         # Scroll to top after filtering
@@ -134,6 +170,48 @@ class ModelSelectorDialog(ctk.CTkToplevel):
         if self.on_select_callback:
             self.on_select_callback(model)
         self.destroy()
+    
+    def destroy(self):
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        super().destroy()
+
+
+# Validation requests share one long-lived worker instead of a thread per click.
+# It is a daemon so a request still in flight never holds up interpreter exit.
+_validation_queue = queue.SimpleQueue()
+_validation_worker: Optional[threading.Thread] = None
+_validation_worker_lock = threading.Lock()
+
+
+def _submit_validation(func: Callable, *args):
+    """Queue func(*args) on the shared validation worker, starting it if needed."""
+    global _validation_worker
+    _validation_queue.put((func, args))
+    with _validation_worker_lock:
+        if _validation_worker is None:
+            _validation_worker = threading.Thread(
+                target=_run_validations, name="api-validate", daemon=True
+            )
+            _validation_worker.start()
+
+
+def _run_validations():
+    while True:
+        func, args = _validation_queue.get()
+        try:
+            func(*args)
+        except Exception:
+            pass  # Callers report their own failures; keep the worker alive
+
+# Status message variant -> text color
+_STATUS_COLORS = {
+    "info": COLORS["text_secondary"],
+    "success": COLORS["success"],
+    "warning": COLORS["warning"],
+    "error": COLORS["error"],
+}
 
 
 class APIKeyPanel(ctk.CTkFrame):
@@ -141,6 +219,8 @@ class APIKeyPanel(ctk.CTkFrame):
     Panel for API key management with validation, model selection, and status display.
     """
     
+    _TOKEN_FMT = "Prompt: {:,} | Completion: {:,} | Total: {:,}".format
+    
     def __init__(
         self,
         master,
@@ -149,20 +229,27 @@ class APIKeyPanel(ctk.CTkFrame):
         show_header: bool = True,
         **kwargs
     ):
-        from .base import StatusBadge
         super().__init__(master, **get_frame_style("card" if show_header else "transparent"), **kwargs)
         
         self.on_validated = on_validated
         self.on_model_changed = on_model_changed
         self.show_header = show_header
+        # Grid options shared by the stacked rows; trailing rows get extra bottom padding
+        self._pad_x = SPACING["md"] if show_header else 0
+        self._row_grid = {"padx": self._pad_x, "pady": SPACING["xs"]}
+        self._last_row_grid = {"padx": self._pad_x, "pady": (SPACING["xs"], SPACING["md"])}
         self.is_validated = False
         self.available_models: List[str] = []
+        self._api_manager = get_api_manager()
+        self._model_info_cache: Dict[str, str] = {}  # model name -> info label text
+        self._last_selected: Optional[str] = None
+        self._preferred_model: Optional[str] = None
+        self._token_text = self._TOKEN_FMT(0, 0, 0)
         
         self._setup_ui()
     
     def _setup_ui(self):
         """Setup the API key panel UI."""
-        from .base import StatusBadge
         self.grid_columnconfigure(0, weight=1)
         
         row_idx = 0
@@ -191,7 +278,7 @@ class APIKeyPanel(ctk.CTkFrame):
         
         # API Key input row
         api_frame = ctk.CTkFrame(self, fg_color="transparent")
-        api_frame.grid(row=row_idx, column=0, sticky="ew", padx=SPACING["md"] if self.show_header else 0, pady=SPACING["xs"])
+        api_frame.grid(row=row_idx, column=0, sticky="ew", **self._row_grid)
         api_frame.grid_columnconfigure(1, weight=1)
         
         api_label = ctk.CTkLabel(
@@ -233,7 +320,20 @@ class APIKeyPanel(ctk.CTkFrame):
         self.validate_btn.grid(row=0, column=3)
         row_idx += 1
         
-        # Model selector row (initially hidden)
+        # Status message
+        self.status_label = ctk.CTkLabel(
+            self,
+            text="",
+            **get_label_style("muted")
+        )
+        self.status_label.grid(row=row_idx, column=0, sticky="w", **self._last_row_grid)
+        
+        # Model selector and token usage rows are only built on first successful validation
+        self._model_widgets_built = False
+    
+    def _build_model_widgets(self):
+        """Create the model selector and token usage rows (gridded by the caller)."""
+        # Model selector row
         self.model_frame = ctk.CTkFrame(self, fg_color="transparent")
         
         model_label = ctk.CTkLabel(
@@ -250,12 +350,7 @@ class APIKeyPanel(ctk.CTkFrame):
             values=["Select model..."],
             command=self._on_model_selected,
             width=300,
-            fg_color=COLORS["bg_dark"],
-            button_color=COLORS["bg_light"],
-            button_hover_color=COLORS["border"],
-            dropdown_fg_color=COLORS["bg_dark"],
-            dropdown_hover_color=COLORS["bg_light"],
-            corner_radius=RADIUS["md"]
+            **get_dropdown_style()
         )
         self.model_dropdown.grid(row=0, column=1, sticky="w")
         
@@ -267,15 +362,7 @@ class APIKeyPanel(ctk.CTkFrame):
         )
         self.model_info_label.grid(row=0, column=2, sticky="w", padx=SPACING["md"])
         
-        # Status message
-        self.status_label = ctk.CTkLabel(
-            self,
-            text="",
-            **get_label_style("muted")
-        )
-        self.status_label.grid(row=row_idx, column=0, sticky="w", padx=SPACING["md"] if self.show_header else 0, pady=(SPACING["xs"], SPACING["md"]))
-        
-        # Token usage display (initially hidden)
+        # Token usage display
         self.token_frame = ctk.CTkFrame(self, fg_color=COLORS["bg_dark"], corner_radius=RADIUS["md"])
         
         token_header = ctk.CTkLabel(
@@ -287,10 +374,12 @@ class APIKeyPanel(ctk.CTkFrame):
         
         self.token_label = ctk.CTkLabel(
             self.token_frame,
-            text="Prompt: 0 | Completion: 0 | Total: 0",
+            text=self._token_text,
             **get_label_style("mono")
         )
         self.token_label.grid(row=1, column=0, sticky="w", padx=SPACING["sm"], pady=(0, SPACING["sm"]))
+        
+        self._model_widgets_built = True
     
     def _toggle_key_visibility(self):
         """Toggle API key visibility."""
@@ -304,7 +393,7 @@ class APIKeyPanel(ctk.CTkFrame):
     
     def _validate_api_key(self):
         """Validate the API key."""
-        api_key = self.api_key_entry.get().strip()
+        api_key = self.get_api_key()
         
         if not api_key:
             self._set_status("Please enter an API key", "error")
@@ -315,19 +404,12 @@ class APIKeyPanel(ctk.CTkFrame):
         self._set_status("Validating API key...", "info")
         
         # Run validation in background
-        import threading
-        thread = threading.Thread(
-            target=self._do_validation,
-            args=(api_key,),
-            daemon=True
-        )
-        thread.start()
+        _submit_validation(self._do_validation, api_key)
     
     def _do_validation(self, api_key: str):
         """Perform API validation (runs in background thread)."""
         try:
-            from core.translator import get_api_manager
-            manager = get_api_manager()
+            manager = self._api_manager
             manager.config.openrouter_api_key = api_key
             manager.config.provider = "openrouter"
             result = manager.validate_connection()
@@ -344,47 +426,47 @@ class APIKeyPanel(ctk.CTkFrame):
         if result.is_valid:
             self.is_validated = True
             self.available_models = [m.short_name for m in result.available_models]
+            self._model_info_cache.clear()
+            self._last_selected = None
+            # Prefer flash models, decided once per model list
+            self._preferred_model = next(
+                (m for m in self.available_models if "flash" in m.lower()),
+                self.available_models[0] if self.available_models else None
+            )
             
             # Update UI
-            self.status_badge.set_text("✓ Validated")
-            self.status_badge.set_variant("success")
+            self.status_badge.set_state("✓ Validated", "success")
             self._set_status(result.message, "success")
             
-            # Show model selector
-            model_row = 2 if self.show_header else 1
-            self.model_frame.grid(row=model_row, column=0, sticky="ew", padx=SPACING["md"] if self.show_header else 0, pady=SPACING["xs"])
+            if not self._model_widgets_built:
+                self._build_model_widgets()
             
-            # Move status label down
-            self.status_label.grid(row=model_row + 1, column=0, sticky="w", padx=SPACING["md"] if self.show_header else 0, pady=(SPACING["xs"], SPACING["md"]))
+            # Fill the dropdown before revealing it, then lay out the model
+            # selector, status and token rows together
             self.model_dropdown.configure(values=self.available_models)
             
             # Auto-select first recommended model
-            if self.available_models:
-                # Prefer flash models
-                for model in self.available_models:
-                    if "flash" in model.lower():
-                        self.model_dropdown.set(model)
-                        self._on_model_selected(model)
-                        break
-                else:
-                    self.model_dropdown.set(self.available_models[0])
-                    self._on_model_selected(self.available_models[0])
+            if self._preferred_model:
+                self.model_dropdown.set(self._preferred_model)
+                self._on_model_selected(self._preferred_model)
             
-            # Show token display
-            self.token_frame.grid(row=model_row + 2, column=0, sticky="ew", padx=SPACING["md"] if self.show_header else 0, pady=(SPACING["xs"], SPACING["md"]))
+            model_row = 2 if self.show_header else 1
+            self.model_frame.grid(row=model_row, column=0, sticky="ew", **self._row_grid)
+            self.status_label.grid(row=model_row + 1, column=0, sticky="w", **self._last_row_grid)
+            self.token_frame.grid(row=model_row + 2, column=0, sticky="ew", **self._last_row_grid)
             
             # Callback
             if self.on_validated:
                 self.on_validated(True, self.available_models)
         else:
             self.is_validated = False
-            self.status_badge.set_text("Invalid")
-            self.status_badge.set_variant("error")
+            self.status_badge.set_state("Invalid", "error")
             self._set_status(result.message, "error")
             
             # Hide model selector
-            self.model_frame.grid_remove()
-            self.token_frame.grid_remove()
+            if self._model_widgets_built:
+                self.model_frame.grid_remove()
+                self.token_frame.grid_remove()
             
             if self.on_validated:
                 self.on_validated(False, [])
@@ -393,8 +475,7 @@ class APIKeyPanel(ctk.CTkFrame):
         """Handle validation error."""
         self.validate_btn.configure(state="normal", text="Validate")
         self.is_validated = False
-        self.status_badge.set_text("Error")
-        self.status_badge.set_variant("error")
+        self.status_badge.set_state("Error", "error")
         self._set_status(f"Validation error: {error}", "error")
         
         if self.on_validated:
@@ -402,25 +483,23 @@ class APIKeyPanel(ctk.CTkFrame):
     
     def _set_status(self, message: str, variant: str = "info"):
         """Set status message with color."""
-        color_map = {
-            "info": COLORS["text_secondary"],
-            "success": COLORS["success"],
-            "warning": COLORS["warning"],
-            "error": COLORS["error"],
-        }
-        self.status_label.configure(text=message, text_color=color_map.get(variant, COLORS["text_secondary"]))
+        self.status_label.configure(text=message, text_color=_STATUS_COLORS.get(variant, COLORS["text_secondary"]))
     
     def _on_model_selected(self, model_name: str):
         """Handle model selection."""
-        # Update model info
-        from core.translator import get_api_manager
-        api_manager = get_api_manager()
+        # Update model info (the selection itself must still reach the manager)
+        api_manager = self._api_manager
         
         if api_manager.select_model(model_name):
-            model_info = api_manager.get_selected_model_info()
-            if model_info:
-                info_text = f"Input: {model_info.input_token_limit:,} | Output: {model_info.output_token_limit:,} tokens"
+            info_text = self._model_info_cache.get(model_name)
+            if info_text is None:
+                model_info = api_manager.get_selected_model_info()
+                if model_info:
+                    info_text = f"Input: {model_info.input_token_limit:,} | Output: {model_info.output_token_limit:,} tokens"
+                    self._model_info_cache[model_name] = info_text
+            if info_text is not None:
                 self.model_info_label.configure(text=info_text)
+            self._last_selected = model_name
         
         if self.on_model_changed:
             self.on_model_changed(model_name)
@@ -436,10 +515,17 @@ class APIKeyPanel(ctk.CTkFrame):
     
     def get_selected_model(self) -> str:
         """Get the selected model name."""
+        if not self._model_widgets_built:
+            return "Select model..."
         return self.model_dropdown.get()
     
     def set_model(self, model_name: str):
         """Set the selected model programmatically."""
+        if not self._model_widgets_built:
+            return  # Nothing to select from until a key has been validated
+        # Restoring the model that is already selected would only repeat the cascade
+        if model_name == self._last_selected and self.model_dropdown.get() == model_name:
+            return
         if model_name in self.available_models:
             self.model_dropdown.set(model_name)
             self._on_model_selected(model_name)
@@ -450,10 +536,10 @@ class APIKeyPanel(ctk.CTkFrame):
     
     def update_token_usage(self, prompt: int, completion: int, total: int):
         """Update the token usage display."""
-        self.token_label.configure(
-            text=f"Prompt: {prompt:,} | Completion: {completion:,} | Total: {total:,}"
-        )
+        self._token_text = self._TOKEN_FMT(prompt, completion, total)
+        if self._model_widgets_built:
+            self.token_label.configure(text=self._token_text)
     
     def reset_token_usage(self):
         """Reset the token usage display."""
-        self.token_label.configure(text="Prompt: 0 | Completion: 0 | Total: 0")
+        self.update_token_usage(0, 0, 0)
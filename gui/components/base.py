@@ -1,8 +1,10 @@
 import customtkinter as ctk
+from tkinter import filedialog
 from typing import Optional, Callable, List
 from .styles import (
     COLORS, FONTS, SPACING, RADIUS,
-    get_button_style, get_input_style, get_frame_style, get_label_style
+    get_button_style, get_input_style, get_frame_style, get_label_style,
+    get_dropdown_style
 )
 
 class TrackListItem(ctk.CTkFrame):
@@ -27,6 +29,35 @@ class TrackListItem(ctk.CTkFrame):
         
         self._setup_ui(track_name, language, codec, is_default)
     
+    @staticmethod
+    def _format_texts(track_id: int, track_name: str, language: str, codec: str, is_default: bool):
+        """Build the title and metadata text for a track."""
+        title_text = f"Track {track_id}"
+        if track_name:
+            title_text += f" - {track_name}"
+        
+        meta_text = f"{language.upper()} • {codec}"
+        if is_default:
+            meta_text += " • Default"
+        return title_text, meta_text
+    
+    def recycle(
+        self,
+        track_id: int,
+        track_name: str,
+        language: str,
+        codec: str,
+        is_default: bool = False,
+        on_select: Optional[Callable[[int, bool], None]] = None
+    ):
+        """Rebind a pooled item to a different track without rebuilding its widgets."""
+        self.track_id = track_id
+        self.on_select = on_select
+        self.is_selected.set(False)
+        title_text, meta_text = self._format_texts(track_id, track_name, language, codec, is_default)
+        self.title_label.configure(text=title_text)
+        self.meta_label.configure(text=meta_text)
+    
     def _setup_ui(self, track_name: str, language: str, codec: str, is_default: bool):
         """Setup the track item UI."""
         self.grid_columnconfigure(1, weight=1)
@@ -48,11 +79,9 @@ class TrackListItem(ctk.CTkFrame):
         info_frame = ctk.CTkFrame(self, fg_color="transparent")
         info_frame.grid(row=0, column=1, sticky="w", pady=SPACING["sm"])
         
-        # Track ID and name
-        title_text = f"Track {self.track_id}"
-        if track_name:
-            title_text += f" - {track_name}"
+        title_text, meta_text = self._format_texts(self.track_id, track_name, language, codec, is_default)
         
+        # Track ID and name
         self.title_label = ctk.CTkLabel(
             info_frame,
             text=title_text,
@@ -61,10 +90,6 @@ class TrackListItem(ctk.CTkFrame):
         self.title_label.pack(anchor="w")
         
         # Language and codec
-        meta_text = f"{language.upper()} • {codec}"
-        if is_default:
-            meta_text += " • Default"
-        
         self.meta_label = ctk.CTkLabel(
             info_frame,
             text=meta_text,
@@ -88,6 +113,15 @@ class TrackListItem(ctk.CTkFrame):
         self._on_checkbox_change()
 
 
+# Badge variant -> (text color, background color)
+_BADGE_COLORS = {
+    "info": (COLORS["info"], COLORS["bg_dark"]),
+    "success": (COLORS["success"], COLORS["success_bg"]),
+    "warning": (COLORS["warning"], COLORS["warning_bg"]),
+    "error": (COLORS["error"], COLORS["error_bg"]),
+}
+
+
 class StatusBadge(ctk.CTkFrame):
     """A small status badge/pill."""
     
@@ -98,14 +132,7 @@ class StatusBadge(ctk.CTkFrame):
         variant: str = "info",  # "info", "success", "warning", "error"
         **kwargs
     ):
-        color_map = {
-            "info": (COLORS["info"], COLORS["bg_dark"]),
-            "success": (COLORS["success"], COLORS["success_bg"]),
-            "warning": (COLORS["warning"], COLORS["warning_bg"]),
-            "error": (COLORS["error"], COLORS["error_bg"]),
-        }
-        
-        text_color, bg_color = color_map.get(variant, color_map["info"])
+        text_color, bg_color = _BADGE_COLORS.get(variant, _BADGE_COLORS["info"])
         
         super().__init__(
             master,
@@ -130,20 +157,22 @@ class StatusBadge(ctk.CTkFrame):
     
     def set_variant(self, variant: str):
         """Update badge variant."""
-        color_map = {
-            "info": (COLORS["info"], COLORS["bg_dark"]),
-            "success": (COLORS["success"], COLORS["success_bg"]),
-            "warning": (COLORS["warning"], COLORS["warning_bg"]),
-            "error": (COLORS["error"], COLORS["error_bg"]),
-        }
-        text_color, bg_color = color_map.get(variant, color_map["info"])
+        text_color, bg_color = _BADGE_COLORS.get(variant, _BADGE_COLORS["info"])
         self.configure(fg_color=bg_color)
         self.label.configure(text_color=text_color)
+    
+    def set_state(self, text: str, variant: str):
+        """Update badge text and variant together."""
+        text_color, bg_color = _BADGE_COLORS.get(variant, _BADGE_COLORS["info"])
+        self.configure(fg_color=bg_color)
+        self.label.configure(text=text, text_color=text_color)
 
 
 class SettingsRow(ctk.CTkFrame):
     """A single settings row with label and input."""
     
+    CHANGE_DEBOUNCE_MS = 100
+    
     def __init__(
         self,
         master,
@@ -163,6 +192,8 @@ class SettingsRow(ctk.CTkFrame):
         self.input_type = input_type
         self.browse_title = browse_title
         self.browse_type = browse_type
+        self._change_after_id = None
+        self._last_emitted: Optional[str] = None
         
         self._setup_ui(label, input_type, default_value, options, placeholder)
     
@@ -197,19 +228,14 @@ class SettingsRow(ctk.CTkFrame):
             self.input.grid(row=0, column=1, sticky="ew")
             if default_value:
                 self.input.insert(0, default_value)
-            self.input.bind("<FocusOut>", lambda e: self._on_value_change())
+            self.input.bind("<FocusOut>", lambda e: self._on_entry_change())
             
         elif input_type == "dropdown":
             self.input = ctk.CTkOptionMenu(
                 self,
                 values=options or [],
                 command=lambda v: self._on_value_change(),
-                fg_color=COLORS["bg_dark"],
-                button_color=COLORS["bg_light"],
-                button_hover_color=COLORS["border"],
-                dropdown_fg_color=COLORS["bg_dark"],
-                dropdown_hover_color=COLORS["bg_light"],
-                corner_radius=RADIUS["md"]
+                **get_dropdown_style()
             )
             self.input.grid(row=0, column=1, sticky="ew")
             if default_value and default_value in (options or []):
@@ -217,7 +243,6 @@ class SettingsRow(ctk.CTkFrame):
                 
         elif input_type == "browse":
             # Container for entry + button
-            from tkinter import filedialog
             browse_frame = ctk.CTkFrame(self, fg_color="transparent")
             browse_frame.grid(row=0, column=1, sticky="ew")
             browse_frame.grid_columnconfigure(0, weight=1)
@@ -242,7 +267,6 @@ class SettingsRow(ctk.CTkFrame):
     
     def _on_browse(self):
         """Handle browse button click."""
-        from tkinter import filedialog
         if self.browse_type == "directory":
             path = filedialog.askdirectory(title=self.browse_title)
         else:
@@ -257,6 +281,23 @@ class SettingsRow(ctk.CTkFrame):
         if self.on_change:
             self.on_change(self.get_value())
     
+    def _on_entry_change(self):
+        """Handle a typed entry change; bursts within CHANGE_DEBOUNCE_MS notify once."""
+        if not self.on_change:
+            return
+        if self._change_after_id is not None:
+            self.after_cancel(self._change_after_id)
+        self._change_after_id = self.after(self.CHANGE_DEBOUNCE_MS, self._flush_entry_change)
+    
+    def _flush_entry_change(self):
+        """Notify on_change if the entry differs from the last value reported."""
+        self._change_after_id = None
+        value = self.get_value()
+        if value == self._last_emitted:
+            return
+        self._last_emitted = value
+        self.on_change(value)
+    
     def get_value(self) -> str:
         """Get the current value."""
         if self.input_type == "dropdown":
@@ -271,3 +312,5 @@ class SettingsRow(ctk.CTkFrame):
         else:
             self.input.delete(0, "end")
             self.input.insert(0, value)
+            # A programmatic value is the new baseline for the entry dedupe
+            self._last_emitted = value
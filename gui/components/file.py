@@ -1,5 +1,8 @@
 import customtkinter as ctk
+import os
+from collections import deque
 from pathlib import Path
+from tkinter import filedialog
 from typing import Optional, Callable, List
 from .styles import (
     COLORS, FONTS, SPACING, RADIUS,
@@ -25,21 +28,19 @@ class FileDropZone(ctk.CTkFrame):
         self.file_types = file_types
         self.on_file_selected = on_file_selected
         self.selected_file: Optional[str] = None
+        self._click_handler = lambda e: self._on_click()  # Shared by every clickable child
         
         self._setup_ui()
     
     def _setup_ui(self):
-        """Setup the drop zone UI."""
+        """Setup the drop zone UI; both states are built once and swapped."""
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
         self._setup_empty_ui()
+        self._setup_compact_ui()
         
     def _setup_empty_ui(self):
         """Setup the empty state UI (Large drop zone)."""
-        # Clear existing
-        for widget in self.winfo_children():
-            widget.destroy()
-            
         # Inner container with dashed border effect
         self.inner_frame = ctk.CTkFrame(
             self,
@@ -109,15 +110,10 @@ class FileDropZone(ctk.CTkFrame):
         # Make clickable
         self._bind_click_recursive(self)
 
-    def _setup_compact_ui(self, path: Path):
-        """Setup the compact state UI (Selected file row)."""
-        # Clear existing
-        for widget in self.winfo_children():
-            widget.destroy()
-            
+    def _setup_compact_ui(self):
+        """Setup the compact state UI (Selected file row), initially hidden."""
         # Container
-        container = ctk.CTkFrame(self, fg_color="transparent")
-        container.grid(row=0, column=0, sticky="ew", padx=SPACING["md"], pady=SPACING["sm"])
+        self.compact_frame = container = ctk.CTkFrame(self, fg_color="transparent")
         container.grid_columnconfigure(1, weight=1)
         
         # Thumbnail placeholder / Icon
@@ -141,22 +137,20 @@ class FileDropZone(ctk.CTkFrame):
         info_frame = ctk.CTkFrame(container, fg_color="transparent")
         info_frame.grid(row=0, column=1, sticky="ew")
         
-        name_lbl = ctk.CTkLabel(
+        self.name_label = ctk.CTkLabel(
             info_frame,
-            text=path.name,
+            text="",
             font=(FONTS["family"], FONTS["body_size"], "bold"),
             text_color=COLORS["text_primary"]
         )
-        name_lbl.pack(anchor="w")
+        self.name_label.pack(anchor="w")
         
-        size_bytes = path.stat().st_size
-        size_str = self._format_size(size_bytes)
-        size_lbl = ctk.CTkLabel(
+        self.size_label = ctk.CTkLabel(
             info_frame,
-            text=f"{size_str} • {path.parent}",
+            text="",
             **get_label_style("muted")
         )
-        size_lbl.pack(anchor="w")
+        self.size_label.pack(anchor="w")
         
         # Change Button
         change_btn = ctk.CTkButton(
@@ -170,21 +164,23 @@ class FileDropZone(ctk.CTkFrame):
         change_btn.grid(row=0, column=2, padx=(SPACING["md"], 0))
 
     def _bind_click_recursive(self, widget):
-        if isinstance(widget, (ctk.CTkLabel, ctk.CTkFrame)):
-             widget.bind("<Button-1>", lambda e: self._on_click())
-             widget.configure(cursor="hand2")
-             
-        for child in widget.winfo_children():
-            self._bind_click_recursive(child)
+        """Make every label and frame under widget open the file dialog."""
+        pending = deque([widget])
+        while pending:
+            w = pending.popleft()
+            if isinstance(w, (ctk.CTkLabel, ctk.CTkFrame)):
+                self._bind_click(w)
+            elif isinstance(w, ctk.CTkButton):
+                continue  # Buttons handle their own clicks
+            pending.extend(w.winfo_children())
     
     def _bind_click(self, widget):
         """Bind click event to a widget."""
-        widget.bind("<Button-1>", lambda e: self._on_click())
+        widget.bind("<Button-1>", self._click_handler)
         widget.configure(cursor="hand2")
     
     def _on_click(self):
         """Handle click event - open file dialog."""
-        from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             title="Select MKV File",
             filetypes=self.file_types
@@ -193,13 +189,24 @@ class FileDropZone(ctk.CTkFrame):
         if file_path:
             self.set_file(file_path)
     
-    def set_file(self, file_path: str):
-        """Set the selected file and update UI."""
+    def set_file(self, file_path: str, stat_result: Optional[os.stat_result] = None):
+        """
+        Set the selected file and update UI.
+        
+        Args:
+            file_path: Selected file
+            stat_result: os.stat of file_path if the caller already has it
+        """
         self.selected_file = file_path
         path = Path(file_path)
+        if stat_result is None:
+            stat_result = os.stat(file_path)
         
         # Switch to compact UI
-        self._setup_compact_ui(path)
+        self.name_label.configure(text=path.name)
+        self.size_label.configure(text=f"{self._format_size(stat_result.st_size)} • {path.parent}")
+        self.inner_frame.grid_remove()
+        self.compact_frame.grid(row=0, column=0, sticky="ew", padx=SPACING["md"], pady=SPACING["sm"])
         
         # Callback
         if self.on_file_selected:
@@ -207,13 +214,15 @@ class FileDropZone(ctk.CTkFrame):
     
     def _format_size(self, size_bytes: int) -> str:
         """Format file size to human readable string."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        units = ('B', 'KB', 'MB', 'GB', 'TB')
+        if size_bytes <= 0:
+            return "0.0 B"
+        # Each unit is 2**10 of the previous one, so the bit length picks it directly
+        idx = min((int(size_bytes).bit_length() - 1) // 10, len(units) - 1)
+        return f"{size_bytes / (1 << (idx * 10)):.1f} {units[idx]}"
     
     def reset(self):
         """Reset the drop zone to initial state."""
         self.selected_file = None
-        self._setup_empty_ui()
+        self.compact_frame.grid_remove()
+        self.inner_frame.grid()
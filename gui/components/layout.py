@@ -5,6 +5,50 @@ from .styles import (
     get_button_style, get_input_style, get_frame_style, get_label_style
 )
 
+# Stepper item styling per state:
+# (icon_color, text_color, desc_color, font_weight, underline_color)
+_STEP_STYLES = {
+    "active": (COLORS["accent"], COLORS["text_primary"], COLORS["text_secondary"], "bold", COLORS["accent"]),
+    "completed": (COLORS["success"], COLORS["text_primary"], COLORS["text_muted"], "normal", COLORS["success_dim"]),
+    "inactive": (COLORS["border"], COLORS["text_muted"], COLORS["text_muted"], "normal", COLORS["border"]),
+}
+
+
+def _step_state(active: bool, completed: bool) -> str:
+    """Key into _STEP_STYLES for a step's state."""
+    return "active" if active else "completed" if completed else "inactive"
+
+
+_STEPPER_BINDTAG = "StepperItem"
+
+_DEFAULT_STEP_DESCRIPTIONS = {
+    1: "Choose the MKV file you want to process.",
+    2: "Pick subtitle track and translation settings.",
+    3: "Run the translation process and monitor progress.",
+    4: "Review translated subtitles before final merge.",
+}
+
+
+def _on_stepper_click(event):
+    """Shared <Button-1> handler for every stepper item widget."""
+    item = getattr(event.widget, "stepper_item", None)
+    if item is not None and item.on_click:
+        item.on_click(item.step_number)
+
+
+def _bind_stepper_click(item, widgets):
+    """Route clicks on widgets to item.on_click through one class-level binding."""
+    if not item.bind_class(_STEPPER_BINDTAG, "<Button-1>"):
+        item.bind_class(_STEPPER_BINDTAG, "<Button-1>", _on_stepper_click)
+    for widget in widgets:
+        widget.configure(cursor="hand2")
+        # CTk widgets draw through inner Tk canvases/labels, which receive the click
+        for target in (widget, *widget.winfo_children()):
+            if target is widget or not isinstance(target, ctk.CTkBaseClass):
+                target.stepper_item = item
+                target.bindtags((_STEPPER_BINDTAG,) + target.bindtags())
+
+
 class CollapsibleFrame(ctk.CTkFrame):
     """
     A frame that can be collapsed/expanded with a header click.
@@ -22,6 +66,7 @@ class CollapsibleFrame(ctk.CTkFrame):
         self.header_frame = ctk.CTkFrame(self, fg_color="transparent", height=40)
         self.header_frame.grid(row=0, column=0, sticky="ew", padx=SPACING["md"], pady=(SPACING["sm"], 0))
         self.header_frame.columnconfigure(2, weight=1)
+        self._header_extra_count = 0  # Widgets added via add_widget_to_header
 
         self.accent_bar = ctk.CTkFrame(
             self.header_frame,
@@ -54,10 +99,11 @@ class CollapsibleFrame(ctk.CTkFrame):
         )
         self.title_lbl.grid(row=0, column=2, sticky="w", padx=SPACING["sm"])
 
-        # Content Frame
+        # Content Frame (gridded once so toggling can grid_remove/grid without options)
         self.content_frame = ctk.CTkFrame(self, fg_color="transparent")
-        if expanded:
-            self.content_frame.grid(row=1, column=0, sticky="nsew", padx=SPACING["md"], pady=SPACING["md"])
+        self.content_frame.grid(row=1, column=0, sticky="nsew", padx=SPACING["md"], pady=SPACING["md"])
+        if not expanded:
+            self.content_frame.grid_remove()
             
         # Bind click on header to toggle
         self.title_lbl.bind("<Button-1>", lambda e: self.toggle())
@@ -65,17 +111,19 @@ class CollapsibleFrame(ctk.CTkFrame):
 
     def toggle(self):
         if self.expanded:
-            self.content_frame.grid_forget()
+            self.content_frame.grid_remove()
             self.toggle_btn.configure(text="▶")
             self.expanded = False
         else:
-            self.content_frame.grid(row=1, column=0, sticky="nsew", padx=SPACING["md"], pady=SPACING["md"])
+            self.content_frame.grid()
             self.toggle_btn.configure(text="▼")
             self.expanded = True
             
     def add_widget_to_header(self, widget, **grid_kwargs):
         """Add a widget (like a badge) to the header (right side)."""
-        widget.grid(row=0, column=4 + len(self.header_frame.grid_slaves(row=0)), **grid_kwargs)
+        # Columns 0-3 are reserved for the accent bar, toggle, title and a hint label
+        widget.grid(row=0, column=4 + self._header_extra_count, **grid_kwargs)
+        self._header_extra_count += 1
         widget.lift()
 
 
@@ -104,101 +152,97 @@ class VerticalStepperItem(ctk.CTkFrame):
         self.is_completed = is_completed
         self.is_last = is_last
         self.on_click = on_click
+        self._number_text = str(step_number)  # Icon text for every non-completed state
         
         self._setup_ui()
         
     def _setup_ui(self):
         self.grid_columnconfigure(1, weight=1)
         
-        # Colors based on state
-        if self.is_active:
-            icon_color = COLORS["accent"] # Changed from primary (text color) to accent (blue)
-            text_color = COLORS["text_primary"]
-            desc_color = COLORS["text_secondary"]
-            font_weight = "bold"
-        elif self.is_completed:
-            icon_color = COLORS["success"]
-            text_color = COLORS["text_primary"]
-            desc_color = COLORS["text_muted"]
-            font_weight = "normal"
-        else:
-            icon_color = COLORS["border"]
-            text_color = COLORS["text_muted"]
-            desc_color = COLORS["text_muted"]
-            font_weight = "normal"
-            
         # Icon / Number
         self.icon_frame = ctk.CTkFrame(
             self,
             width=32,
             height=32,
-            corner_radius=16,
-            fg_color=icon_color
+            corner_radius=16
         )
         self.icon_frame.grid(row=0, column=0, sticky="n")
         
         # Center the number/check
-        icon_text = "✓" if self.is_completed and not self.is_active else str(self.step_number)
-        
         self.icon_label = ctk.CTkLabel(
             self.icon_frame,
-            text=icon_text,
-            font=(FONTS["family"], 14, "bold"),
-            text_color="white" if self.is_active or self.is_completed else COLORS["text_secondary"]
+            text="",
+            font=(FONTS["family"], 14, "bold")
         )
         self.icon_label.place(relx=0.5, rely=0.5, anchor="center")
         
         # Title
         self.title_label = ctk.CTkLabel(
             self,
-            text=self.title,
-            font=(FONTS["family"], FONTS["body_size"], font_weight),
-            text_color=text_color
+            text=self.title
         )
         self.title_label.grid(row=0, column=1, sticky="w", padx=SPACING["md"], pady=(2, 0))
         
-        # Description (Subtitle)
-        if self.description:
-            self.desc_label = ctk.CTkLabel(
-                self,
-                text=self.description,
-                font=(FONTS["family"], FONTS["small_size"]),
-                text_color=desc_color,
-                wraplength=160,
-                justify="left"
-            )
-            self.desc_label.grid(row=1, column=1, sticky="w", padx=SPACING["md"], pady=(0, 4))
+        # Description (Subtitle), gridded only while there is text to show
+        self.desc_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=(FONTS["family"], FONTS["small_size"]),
+            wraplength=160,
+            justify="left"
+        )
         
         # Connector Line (if not last)
         if not self.is_last:
             self.line = ctk.CTkFrame(
                 self,
                 width=2,
-                height=15, # Minimum height
-                fg_color=COLORS["success"] if self.is_completed else COLORS["border"]
+                height=15 # Minimum height
             )
-            
-            # If description exists, line needs to span more rows or be placed differently
-            # Simple grid approach: place in row 1 (and 2 if desc)
-            row_span = 2 if self.description else 1
-            self.line.grid(row=1, column=0, rowspan=row_span, sticky="n", pady=(2, 0))
             # Ensure line stretches to fill height
             self.grid_rowconfigure(1, weight=1)
             
         # Click event
         if self.on_click:
-            for widget in [self, self.title_label, self.icon_frame, self.icon_label]:
-                widget.bind("<Button-1>", lambda e: self.on_click(self.step_number))
-            if self.description:
-                self.desc_label.bind("<Button-1>", lambda e: self.on_click(self.step_number))
-            
-            # Cursor
-            self.configure(cursor="hand2")
-            self.title_label.configure(cursor="hand2")
-            self.icon_frame.configure(cursor="hand2")
-            self.icon_label.configure(cursor="hand2")
-            if self.description:
-                self.desc_label.configure(cursor="hand2")
+            _bind_stepper_click(self, [self, self.title_label, self.icon_frame, self.icon_label, self.desc_label])
+        
+        self._apply_state()
+    
+    def set_state(self, is_active: bool, is_completed: bool, description: Optional[str] = None):
+        """Restyle the item in place for a new step state."""
+        if (is_active, is_completed, description) == (self.is_active, self.is_completed, self.description):
+            return
+        self.is_active = is_active
+        self.is_completed = is_completed
+        self.description = description
+        self._apply_state()
+    
+    def _apply_state(self):
+        icon_color, text_color, desc_color, font_weight, _ = _STEP_STYLES[
+            _step_state(self.is_active, self.is_completed)
+        ]
+        
+        self.icon_frame.configure(fg_color=icon_color)
+        self.icon_label.configure(
+            text="✓" if self.is_completed and not self.is_active else self._number_text,
+            text_color="white" if self.is_active or self.is_completed else COLORS["text_secondary"]
+        )
+        self.title_label.configure(
+            font=(FONTS["family"], FONTS["body_size"], font_weight),
+            text_color=text_color
+        )
+        
+        if self.description:
+            self.desc_label.configure(text=self.description, text_color=desc_color)
+            self.desc_label.grid(row=1, column=1, sticky="w", padx=SPACING["md"], pady=(0, 4))
+        else:
+            self.desc_label.grid_remove()
+        
+        if not self.is_last:
+            self.line.configure(fg_color=COLORS["success"] if self.is_completed else COLORS["border"])
+            # With a description the line spans both rows beside it
+            row_span = 2 if self.description else 1
+            self.line.grid(row=1, column=0, rowspan=row_span, sticky="n", pady=(2, 0))
 
 
 class VerticalStepper(ctk.CTkFrame):
@@ -221,34 +265,49 @@ class VerticalStepper(ctk.CTkFrame):
         self.step_descriptions = {} # step_idx -> text
         self.completed_steps = set() # Set of completed step indices
         self.items = []
+        self._refresh_pending = False
         
-        self._refresh()
+        self._do_refresh()
         
     def _refresh(self):
-        # Clear
-        for widget in self.winfo_children():
-            widget.destroy()
-        self.items = []
-        
-        for i, title in enumerate(self.steps, 1):
-            is_active = (i == self.current_step)
-            is_completed = (i in self.completed_steps) or (i < self.current_step)
-            is_last = (i == len(self.steps))
-            
-            desc = self.step_descriptions.get(i)
+        """Schedule a redraw; several updates in one event loop pass draw once."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._flush_refresh)
+    
+    def _flush_refresh(self):
+        self._refresh_pending = False
+        self._do_refresh()
+    
+    def _do_refresh(self):
+        # Rebuild only when the step list itself changed; otherwise restyle in place
+        if [item.title for item in self.items] != list(self.steps):
+            for widget in self.winfo_children():
+                widget.destroy()
+            self.items = []
             
-            item = VerticalStepperItem(
-                self,
-                step_number=i,
-                title=title,
-                description=desc,
-                is_active=is_active,
-                is_completed=is_completed,
-                is_last=is_last,
-                on_click=self._handle_click
+            for i, title in enumerate(self.steps, 1):
+                item = VerticalStepperItem(
+                    self,
+                    step_number=i,
+                    title=title,
+                    description=self.step_descriptions.get(i),
+                    is_active=(i == self.current_step),
+                    is_completed=(i in self.completed_steps) or (i < self.current_step),
+                    is_last=(i == len(self.steps)),
+                    on_click=self._handle_click
+                )
+                item.pack(fill="x", pady=0)
+                self.items.append(item)
+            return
+        
+        for i, item in enumerate(self.items, 1):
+            item.set_state(
+                is_active=(i == self.current_step),
+                is_completed=(i in self.completed_steps) or (i < self.current_step),
+                description=self.step_descriptions.get(i)
             )
-            item.pack(fill="x", pady=0)
-            self.items.append(item)
             
     def _handle_click(self, step_number: int):
         # Prevent jumping ahead to incomplete steps if desired
@@ -323,19 +382,6 @@ class HorizontalStepperItem(ctk.CTkFrame):
         self.grid_rowconfigure(0, weight=0)
         self.grid_rowconfigure(1, weight=0)
 
-        if self.is_active:
-            text_color = COLORS["text_primary"]
-            font_weight = "bold"
-            underline_color = COLORS["accent"]
-        elif self.is_completed:
-            text_color = COLORS["text_primary"]
-            font_weight = "normal"
-            underline_color = COLORS["success_dim"]
-        else:
-            text_color = COLORS["text_muted"]
-            font_weight = "normal"
-            underline_color = COLORS["border"]
-
         self.configure(
             fg_color="transparent",
             corner_radius=0,
@@ -346,30 +392,44 @@ class HorizontalStepperItem(ctk.CTkFrame):
 
         self.title_label = ctk.CTkLabel(
             self,
-            text=self.title,
-            font=(FONTS["family"], FONTS["body_size"] - 1, font_weight),
-            text_color=text_color
+            text=self.title
         )
         self.title_label.grid(row=0, column=0, sticky="w", padx=(0, SPACING["md"]), pady=(0, 3))
 
         self.underline = ctk.CTkFrame(
             self,
-            height=2 if self.is_active else 1,
             corner_radius=0,
-            fg_color=underline_color,
             width=1
         )
         self.underline.grid(row=1, column=0, sticky="ew", padx=(0, SPACING["md"]))
             
         # Click binding
         if self.on_click:
-            self.bind("<Button-1>", lambda e: self.on_click(self.step_number))
-            self.title_label.bind("<Button-1>", lambda e: self.on_click(self.step_number))
-            self.underline.bind("<Button-1>", lambda e: self.on_click(self.step_number))
-            
-            self.configure(cursor="hand2")
-            self.title_label.configure(cursor="hand2")
-            self.underline.configure(cursor="hand2")
+            _bind_stepper_click(self, [self, self.title_label, self.underline])
+        
+        self._apply_state()
+    
+    def set_state(self, is_active: bool, is_completed: bool):
+        """Restyle the item in place for a new step state."""
+        if (is_active, is_completed) == (self.is_active, self.is_completed):
+            return
+        self.is_active = is_active
+        self.is_completed = is_completed
+        self._apply_state()
+    
+    def _apply_state(self):
+        _, text_color, _, font_weight, underline_color = _STEP_STYLES[
+            _step_state(self.is_active, self.is_completed)
+        ]
+
+        self.title_label.configure(
+            font=(FONTS["family"], FONTS["body_size"] - 1, font_weight),
+            text_color=text_color
+        )
+        self.underline.configure(
+            height=2 if self.is_active else 1,
+            fg_color=underline_color
+        )
 
 
 class HorizontalStepper(ctk.CTkFrame):
@@ -391,33 +451,52 @@ class HorizontalStepper(ctk.CTkFrame):
         self.on_step_change = on_step_change
         self.completed_steps = set()
         self.step_descriptions = {} # Ignored but kept for interface compatibility
+        self.items: List[HorizontalStepperItem] = []
         
-        self._refresh()
+        # Centering container, kept across rebuilds
+        self.container = ctk.CTkFrame(self, fg_color="transparent")
+        self.container.pack(side="left", anchor="center")
+        self._refresh_pending = False
+        
+        self._do_refresh()
         
     def _refresh(self):
-        # Clear existing
-        for widget in self.winfo_children():
-            widget.destroy()
+        """Schedule a redraw; several updates in one event loop pass draw once."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._flush_refresh)
+    
+    def _flush_refresh(self):
+        self._refresh_pending = False
+        self._do_refresh()
+    
+    def _do_refresh(self):
+        # Rebuild only when the step list itself changed; otherwise restyle in place
+        if [item.title for item in self.items] != list(self.steps):
+            for widget in self.container.winfo_children():
+                widget.destroy()
+            self.items = []
             
-        # Centering container
-        container = ctk.CTkFrame(self, fg_color="transparent")
-        container.pack(side="left", anchor="center")
+            for i, title in enumerate(self.steps, 1):
+                item = HorizontalStepperItem(
+                    self.container,
+                    step_number=i,
+                    title=title,
+                    is_active=(i == self.current_step),
+                    is_completed=(i in self.completed_steps) or (i < self.current_step),
+                    is_last=(i == len(self.steps)),
+                    on_click=self._handle_click
+                )
+                item.pack(side="left", padx=(0, SPACING["md"]), pady=0)
+                self.items.append(item)
+            return
         
-        for i, title in enumerate(self.steps, 1):
-            is_active = (i == self.current_step)
-            is_completed = (i in self.completed_steps) or (i < self.current_step)
-            is_last = (i == len(self.steps))
-            
-            item = HorizontalStepperItem(
-                container,
-                step_number=i,
-                title=title,
-                is_active=is_active,
-                is_completed=is_completed,
-                is_last=is_last,
-                on_click=self._handle_click
+        for i, item in enumerate(self.items, 1):
+            item.set_state(
+                is_active=(i == self.current_step),
+                is_completed=(i in self.completed_steps) or (i < self.current_step)
             )
-            item.pack(side="left", padx=(0, SPACING["md"]), pady=0)
             
     def _handle_click(self, step_number: int):
         if self.on_step_change:
@@ -564,13 +643,7 @@ class ContentProgressHeader(ctk.CTkFrame):
                 sep.pack(side="left", padx=(SPACING["xs"], SPACING["xs"]))
 
     def _default_description(self, step_index: int) -> str:
-        defaults = {
-            1: "Choose the MKV file you want to process.",
-            2: "Pick subtitle track and translation settings.",
-            3: "Run the translation process and monitor progress.",
-            4: "Review translated subtitles before final merge.",
-        }
-        return defaults.get(step_index, "")
+        return _DEFAULT_STEP_DESCRIPTIONS.get(step_index, "")
 
     def set_step(self, step_number: int):
         if 1 <= step_number <= len(self.steps) + 1:
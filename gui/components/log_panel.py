@@ -1,21 +1,50 @@
 import customtkinter as ctk
+import queue
+import re
+import threading
 import time
+from tkinter import filedialog
 from .styles import (
     COLORS, FONTS, SPACING, RADIUS
 )
 
+# Log level -> textbox tag; other levels are INFO unless the message reads as a success
+_LEVEL_TAG = {"ERROR": "ERROR", "CRITICAL": "ERROR", "WARNING": "WARNING"}
+_SUCCESS_RE = re.compile(r"success|complete", re.IGNORECASE)
+
+# Textbox tag -> collapsed preview color
+_PREVIEW_COLORS = {
+    "ERROR": COLORS["error"],
+    "WARNING": COLORS["warning"],
+    "SUCCESS": COLORS["success"],
+}
+
 class LogPanel(ctk.CTkFrame):
     """
     Expandable activity log panel.
     Displays logs from the core Logger.
     """
     
+    # The textbox keeps at most MAX_LINES lines; the oldest TRIM_SLACK are
+    # dropped together once the limit is exceeded by that many
+    MAX_LINES = 2000
+    TRIM_SLACK = 200
+    DRAIN_MS = 50       # Poll interval for lines queued by the logger
+    DRAIN_LIMIT = 500   # Max lines written per poll so bursts don't starve input
+    
     def __init__(self, parent, logger_instance, on_toggle=None, expanded=False, **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
         
         self.logger = logger_instance
         self.on_toggle = on_toggle
         self.is_expanded = expanded
+        self._line_count = 0
+        # Logger callbacks only enqueue; the Tk thread drains on a timer
+        self._log_queue = queue.SimpleQueue()
+        self._drain_job = None
+        # Newest (tag, level, message) and the one the preview label shows
+        self._preview_source = None
+        self._preview_shown = None
         
         # Header (Always visible)
         self.header_frame = ctk.CTkFrame(self, fg_color=COLORS["bg_medium"], height=40, corner_radius=RADIUS["md"])
@@ -106,6 +135,7 @@ class LogPanel(ctk.CTkFrame):
         
         # Register callback
         self.logger.add_callback(self.append_log)
+        self._drain_job = self.after(self.DRAIN_MS, self._drain_queue)
         
     def _toggle_expand(self):
         """Toggle panel expansion."""
@@ -120,70 +150,113 @@ class LogPanel(ctk.CTkFrame):
             self.toggle_btn.configure(text="▶ Activity Log")
             self.content_frame.pack_forget()
             self.actions_frame.pack_forget()
+            self._update_preview()
             self.preview_label.pack(side="left", fill="x", expand=True, padx=SPACING["md"])
             
         if self.on_toggle:
             self.on_toggle(self.is_expanded)
             
+    def _update_preview(self):
+        """Show the newest log line in the collapsed header, if it changed."""
+        if self._preview_source is None or self._preview_source == self._preview_shown:
+            return
+        tag, level, message = self._preview_source
+        preview_text = f"[{level}] {message}"
+        if len(preview_text) > 80:
+            preview_text = preview_text[:77] + "..."
+        self.preview_label.configure(
+            text=preview_text,
+            text_color=_PREVIEW_COLORS.get(tag, COLORS["text_muted"])
+        )
+        self._preview_shown = self._preview_source
+            
     def append_log(self, timestamp: str, level: str, message: str):
-        """Callback to add log message."""
-        formatted_line = f"[{timestamp}] [{level}] {message}\n"
-        
-        # Determine tag based on level
-        tag = "INFO"
-        if level in ["ERROR", "CRITICAL"]:
-            tag = "ERROR"
-        elif level == "WARNING":
-            tag = "WARNING"
-        elif "success" in message.lower() or "complete" in message.lower():
-            tag = "SUCCESS"
+        """Callback to add log message (may be called from any thread; never touches Tk)."""
+        self._log_queue.put((timestamp, level, message))
+    
+    def _drain_queue(self):
+        """Periodic main-thread poll that writes queued log lines to the textbox."""
+        entries = []
+        queue_get = self._log_queue.get_nowait
+        try:
+            while len(entries) < self.DRAIN_LIMIT:
+                timestamp, level, message = queue_get()
+                tag = _LEVEL_TAG.get(level)
+                if tag is None:
+                    tag = "SUCCESS" if _SUCCESS_RE.search(message) else "INFO"
+                entries.append((tag, f"[{timestamp}] [{level}] {message}\n", level, message))
+        except queue.Empty:
+            pass
+        
+        if entries:
+            self._write_entries(entries)
+        
+        if len(entries) == self.DRAIN_LIMIT:
+            # Backlog left over: continue as soon as pending input has been handled
+            self._drain_job = self.after_idle(self._drain_queue)
+        else:
+            self._drain_job = self.after(self.DRAIN_MS, self._drain_queue)
+    
+    def _write_entries(self, entries):
+        """Write a batch of log lines to the textbox in one pass."""
+        try:
+            # Only the newest line can show in the preview, and only while collapsed
+            tag, _, level, message = entries[-1]
+            self._preview_source = (tag, level, message)
+            if not self.is_expanded:
+                self._update_preview()
             
-        def _update_ui():
-            try:
-                # Update preview (if not expanded)
-                if not self.is_expanded:
-                    preview_text = f"[{level}] {message}"
-                    if len(preview_text) > 80:
-                        preview_text = preview_text[:77] + "..."
-                    
-                    # Set preview color
-                    color = COLORS["text_muted"]
-                    if tag == "ERROR":
-                        color = COLORS["error"]
-                    elif tag == "WARNING":
-                        color = COLORS["warning"]
-                    elif tag == "SUCCESS":
-                        color = COLORS["success"]
-                        
-                    self.preview_label.configure(text=preview_text, text_color=color)
-                
-                # Update text widget
-                self.log_text.configure(state="normal")
-                self.log_text.insert("end", formatted_line, tag)
-                self.log_text.see("end")
-                self.log_text.configure(state="disabled")
-            except Exception:
-                pass # GUI might be destroyed
-
-        # Ensure UI updates happen on main thread
-        self.after(0, _update_ui)
+            # Update text widget, one insert per run of lines sharing a tag
+            self.log_text.configure(state="normal")
+            run_tag, run_lines = entries[0][0], []
+            for tag, line, _, _ in entries:
+                if tag != run_tag:
+                    self.log_text.insert("end", "".join(run_lines), run_tag)
+                    run_tag, run_lines = tag, []
+                run_lines.append(line)
+            self.log_text.insert("end", "".join(run_lines), run_tag)
+            
+            # Count text lines, not entries: multi-line messages add several
+            self._line_count += sum(line.count("\n") for _, line, _, _ in entries)
+            if self._line_count > self.MAX_LINES + self.TRIM_SLACK:
+                excess = self._line_count - self.MAX_LINES
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+                self._line_count -= excess
+            self.log_text.see("end")
+            self.log_text.configure(state="disabled")
+        except Exception:
+            pass # GUI might be destroyed
         
+    def destroy(self):
+        """Detach from the logger and stop polling the log queue before tearing down."""
+        self.logger.remove_callback(self.append_log)
+        if self._drain_job is not None:
+            self.after_cancel(self._drain_job)
+            self._drain_job = None
+        super().destroy()
+    
     def _clear_logs(self):
         """Clear all logs."""
         self.logger.clear()
         self.log_text.configure(state="normal")
         self.log_text.delete("0.0", "end")
+        self._line_count = 0
         self.log_text.configure(state="disabled")
+        self._preview_source = self._preview_shown = None
         self.preview_label.configure(text="Logs cleared")
         
     def _save_logs(self):
         """Save logs to file."""
-        from tkinter import filedialog
         filename = filedialog.asksaveasfilename(
             defaultextension=".txt",
             filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")],
             initialfile=f"subauto_log_{int(time.time())}.txt"
         )
         if filename:
-            self.logger.save_to_file(filename)
+            threading.Thread(target=self._write_log_file, args=(filename,), daemon=True).start()
+    
+    def _write_log_file(self, filename: str):
+        """Write the log history to disk (runs in background thread)."""
+        # Logger calls are thread-safe; the panel only sees them via its queue
+        if self.logger.save_to_file(filename):
             self.logger.info(f"Log saved to: {filename}")
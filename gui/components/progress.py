@@ -1,5 +1,5 @@
 import customtkinter as ctk
-from typing import Optional, Callable
+from typing import Optional, Callable, List
 from .styles import (
     COLORS, FONTS, SPACING, RADIUS,
     get_frame_style, get_label_style
@@ -13,6 +13,11 @@ class SegmentedProgressBar(ctk.CTkFrame):
     - Dynamic segment count
     - Pulse animation on leading edge
     """
+    PULSE_STEPS = 10  # Frames per fade direction
+    PULSE_FRAME_MS = 30
+    HIDDEN_POLL_MS = 500  # Re-check interval while an ancestor hides the bar
+    RESIZE_DEBOUNCE_MS = 50
+    
     def __init__(
         self,
         master,
@@ -39,29 +44,45 @@ class SegmentedProgressBar(ctk.CTkFrame):
         self.progress = 0.0
         self._current_width = 1
         self._segments_count = 0
+        self._seg_ids: List[int] = []  # Canvas item ids, indexed by segment
         self._active_count = 0
+        self._full_redraw = True  # Recolor every segment on the next update
         self._pulse_direction = 1 # 1 for fade in, -1 for fade out
-        self._pulse_alpha = 0.0   # 0.0 to 1.0 interpolation factor
+        self._pulse_step = 0      # 0 to PULSE_STEPS, index into the pulse color table
         self._anim_running = False
+        self._anim_after_id = None
+        self._resize_after_id = None
+        self._build_pulse_lut()
         
         # Canvas Setup
-        # Resolve transparent to actual color (Canvas doesn't support 'transparent')
-        bg_color = self._apply_appearance_mode(self._fg_color)
-        if bg_color == "transparent":
-            bg_color = self._apply_appearance_mode(COLORS["bg_medium"])
-            
+        self._resolved_bg = self._resolve_bg()
         self.canvas = ctk.CTkCanvas(
             self,
             height=height,
-            bg=bg_color,
+            bg=self._resolved_bg,
             highlightthickness=0,
             borderwidth=0
         )
         self.canvas.pack(fill="both", expand=True)
         
-        # Bind events
-        self.bind("<Configure>", self._on_resize)
+        # Bind events (the canvas fills the frame, so its width is the one that matters)
         self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind("<Map>", self._on_map)
+        self.canvas.bind("<Unmap>", self._on_unmap)
+
+    def _resolve_bg(self) -> str:
+        """Resolve transparent to actual color (Canvas doesn't support 'transparent')."""
+        bg_color = self._apply_appearance_mode(self._fg_color)
+        if bg_color == "transparent":
+            bg_color = self._apply_appearance_mode(COLORS["bg_medium"])
+        return bg_color
+
+    def _set_appearance_mode(self, mode_string):
+        """Re-resolve the cached canvas background when the theme changes."""
+        super()._set_appearance_mode(mode_string)
+        if hasattr(self, 'canvas'):
+            self._resolved_bg = self._resolve_bg()
+            self.canvas.configure(bg=self._resolved_bg)
 
     def _apply_appearance_mode(self, color):
         """Handle ctk color tuples/single values."""
@@ -70,18 +91,24 @@ class SegmentedProgressBar(ctk.CTkFrame):
         return color
 
     def _on_resize(self, event):
-        """Handle resize."""
+        """Handle resize, rebuilding segments once the resize settles."""
         if event.width <= 1 or event.width == self._current_width:
             return
             
         self._current_width = event.width
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(self.RESIZE_DEBOUNCE_MS, self._do_draw)
+
+    def _do_draw(self):
+        self._resize_after_id = None
         self._draw()
 
     def _draw(self, no_color_updates=False, **kwargs):
         """Draw segments."""
-        # Try to get actual width if not stored
+        # Try to get actual width if not stored; without one, the first
+        # <Configure> event draws instead of forcing a layout pass here
         if self._current_width <= 1:
-            self.update_idletasks() # Ensure layout is updated
             self._current_width = self.winfo_width()
 
         if self._current_width <= 1:
@@ -97,22 +124,28 @@ class SegmentedProgressBar(ctk.CTkFrame):
         total_unit = self.segment_width + self.spacing
         self._segments_count = max(1, int((self._current_width + self.spacing) // total_unit))
         
-        # Draw all inactive first
-        for i in range(self._segments_count):
-            x = i * total_unit
-            self._draw_round_rect(
-                x, 0, x + self.segment_width, self.height, 
-                radius=self.corner_radius, 
-                fill=self.inactive_color,
-                tag=f"seg_{i}"
+        # Draw all inactive first; every segment is the same shape shifted
+        # along x, so the outline is computed once and translated
+        base_points = self._round_rect_points(0, 0, self.segment_width, self.height, self.corner_radius)
+        x_mask = (1, 0) * (len(base_points) // 2)
+        create_polygon = self.canvas.create_polygon
+        inactive = self.inactive_color
+        self._seg_ids = [
+            create_polygon(
+                [v + dx * m for v, m in zip(base_points, x_mask)],
+                smooth=True, fill=inactive
             )
+            for dx in range(0, self._segments_count * total_unit, total_unit)
+        ]
             
         # Redraw active state
+        self._full_redraw = True
         self._update_colors()
 
-    def _draw_round_rect(self, x1, y1, x2, y2, radius, **kwargs):
-        """Draw a rounded rectangle using polygon."""
-        points = [
+    @staticmethod
+    def _round_rect_points(x1, y1, x2, y2, radius) -> List[int]:
+        """Flat x, y point list outlining a rounded rectangle."""
+        return [
             x1 + radius, y1,
             x2 - radius, y1,
             x2, y1, x2, y1 + radius,
@@ -123,20 +156,47 @@ class SegmentedProgressBar(ctk.CTkFrame):
             x1, y1 + radius,
             x1, y1
         ]
-        return self.canvas.create_polygon(points, smooth=True, **kwargs)
 
     def set(self, value: float):
         """Set progress (0.0 - 1.0)."""
         self.progress = max(0.0, min(1.0, value))
+        if self.progress in (0.0, 1.0):
+            self._full_redraw = True  # Clear any pulse tint left on the edge
         self._update_colors()
         
         # Start/Stop pulse
         if self.progress > 0 and self.progress < 1:
-            if not self._anim_running:
-                self._anim_running = True
+            self._anim_running = True
+            if self._anim_after_id is None:
                 self._animate_pulse()
         else:
-            self._anim_running = False # Stop on 0 or complete
+            self._stop_pulse() # Stop on 0 or complete
+
+    def _stop_pulse(self):
+        """Stop the pulse animation and cancel its pending frame."""
+        self._anim_running = False
+        self._cancel_pulse_frame()
+
+    def _cancel_pulse_frame(self):
+        if self._anim_after_id is not None:
+            self.after_cancel(self._anim_after_id)
+            self._anim_after_id = None
+
+    def _on_map(self, event):
+        """Resume pulsing once the bar is back on screen."""
+        if self._anim_running and self._anim_after_id is None:
+            self._animate_pulse()
+
+    def _on_unmap(self, event):
+        """Pause pulsing while the bar is hidden; _on_map resumes it."""
+        self._cancel_pulse_frame()
+
+    def destroy(self):
+        self._stop_pulse()
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        super().destroy()
 
     def _update_colors(self):
         """Update segment colors."""
@@ -147,38 +207,60 @@ class SegmentedProgressBar(ctk.CTkFrame):
             return
 
         target_active = int(self.progress * self._segments_count)
+        prev_active = self._active_count
+        
+        if self._full_redraw:
+            self._full_redraw = False
+            indices = range(self._segments_count)
+        else:
+            # Only segments that flipped state, plus the old leading edge,
+            # which may still carry a pulse tint
+            indices = list(range(min(prev_active, target_active), max(prev_active, target_active)))
+            if 0 < prev_active < target_active:
+                indices.append(prev_active - 1)
         
-        for i in range(self._segments_count):
-            tag = f"seg_{i}"
+        seg_ids = self._seg_ids
+        for i in indices:
             color = self.active_color if i < target_active else self.inactive_color
-            self.canvas.itemconfig(tag, fill=color)
+            self.canvas.itemconfig(seg_ids[i], fill=color)
             
         self._active_count = target_active
 
     def _animate_pulse(self):
         """Pulse the last active segment."""
+        self._anim_after_id = None
         if not self._anim_running or self._active_count <= 0:
             return
+        
+        if not self.winfo_viewable():
+            # Hidden by an ancestor (which sends no <Unmap> here): idle-poll
+            # rarely instead of animating off screen
+            self._anim_after_id = self.after(self.HIDDEN_POLL_MS, self._animate_pulse)
+            return
 
         # Target segment: the last one that is active (leading edge)
-        target_idx = self._active_count - 1
-        tag = f"seg_{target_idx}"
+        target_id = self._seg_ids[self._active_count - 1]
         
-        # Oscillate alpha
-        self._pulse_alpha += 0.1 * self._pulse_direction
-        if self._pulse_alpha >= 1.0:
-            self._pulse_alpha = 1.0
+        # Oscillate between the active and pulse colors
+        self._pulse_step += self._pulse_direction
+        if self._pulse_step >= self.PULSE_STEPS:
+            self._pulse_step = self.PULSE_STEPS
             self._pulse_direction = -1
-        elif self._pulse_alpha <= 0.0:
-            self._pulse_alpha = 0.0
+        elif self._pulse_step <= 0:
+            self._pulse_step = 0
             self._pulse_direction = 1
             
-        # Interpolate Color
-        current_color = self._interpolate_color(self.active_color, self.pulse_color, self._pulse_alpha)
-        self.canvas.itemconfig(tag, fill=current_color)
+        self.canvas.itemconfig(target_id, fill=self._pulse_lut[self._pulse_step])
         
         # Schedule next frame (30ms ~ 33fps)
-        self.after(30, self._animate_pulse)
+        self._anim_after_id = self.after(self.PULSE_FRAME_MS, self._animate_pulse)
+
+    def _build_pulse_lut(self):
+        """Precompute the pulse fade colors so animation frames are table lookups."""
+        self._pulse_lut = [
+            self._interpolate_color(self.active_color, self.pulse_color, i / self.PULSE_STEPS)
+            for i in range(self.PULSE_STEPS + 1)
+        ]
 
     def _interpolate_color(self, c1, c2, t):
         """Interpolate between two hex colors."""
@@ -197,9 +279,12 @@ class SegmentedProgressBar(ctk.CTkFrame):
     def configure(self, **kwargs):
         if "progress_color" in kwargs:
             self.active_color = kwargs.pop("progress_color")
+            self._build_pulse_lut()
+            self._full_redraw = True
             self._update_colors()
         if "fg_color" in kwargs:
             self.inactive_color = kwargs.pop("fg_color")
+            self._full_redraw = True
             self._update_colors()
         super().configure(**kwargs)
 
@@ -210,6 +295,9 @@ class ProgressPanel(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
         super().__init__(master, **get_frame_style("card"), **kwargs)
         
+        self._pending_progress = None
+        self._flush_scheduled = False
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -260,7 +348,24 @@ class ProgressPanel(ctk.CTkFrame):
     def set_progress(self, value: float, status: str = "", detail: str = ""):
         """
         Update progress.
+        
+        Calls are coalesced: only the latest values are drawn, once per idle cycle.
         """
+        if not status and self._pending_progress:
+            status = self._pending_progress[1]
+        self._pending_progress = (value, status, detail)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_progress)
+    
+    def _flush_progress(self):
+        """Apply the latest pending progress update."""
+        self._flush_scheduled = False
+        if self._pending_progress is None:
+            return
+        value, status, detail = self._pending_progress
+        self._pending_progress = None
+        
         self.progress_bar.set(value)
         
         if status:
@@ -282,17 +387,24 @@ class ProgressPanel(ctk.CTkFrame):
     
     def reset(self):
         """Reset progress panel."""
+        self._pending_progress = None
         self.progress_bar.set(0)
         self.status_label.configure(text="Ready")
         self.detail_label.configure(text="")
     
     def set_success(self, message: str = "Complete!"):
         """Show success state."""
+        self._pending_progress = None
         self.progress_bar.set(1)
-        self.progress_bar.configure(progress_color=COLORS["success"])
-        self.status_label.configure(text=message, text_color=COLORS["success"])
+        self._set_state("success", message)
     
     def set_error(self, message: str = "Error occurred"):
         """Show error state."""
-        self.progress_bar.configure(progress_color=COLORS["error"])
-        self.status_label.configure(text=message, text_color=COLORS["error"])
+        self._flush_progress()
+        self._set_state("error", message)
+    
+    def _set_state(self, color_key: str, message: str):
+        """Color the bar and status text for a final state."""
+        color = COLORS[color_key]
+        self.progress_bar.configure(progress_color=color)
+        self.status_label.configure(text=message, text_color=color)
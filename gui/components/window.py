@@ -7,6 +7,24 @@ from .styles import (
     get_button_style, get_label_style
 )
 
+# Win32 calls used by the title bar, bound once with explicit signatures.
+# A private handle keeps these prototypes off the shared ctypes.windll.user32.
+try:
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _user32.GetParent.argtypes = [ctypes.c_void_p]
+    _user32.GetParent.restype = ctypes.c_void_p
+    _user32.ShowWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    _user32.ShowWindow.restype = ctypes.c_int
+    _user32.SetWindowPos.argtypes = [
+        ctypes.c_void_p, ctypes.c_void_p,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_uint
+    ]
+    _user32.SetWindowPos.restype = ctypes.c_int
+except AttributeError:  # Not on Windows
+    _user32 = None
+
+SWP_MOVE_ONLY = 0x0001 | 0x0004 | 0x0010  # SWP_NOSIZE | SWP_NOZORDER | SWP_NOACTIVATE
+
 class CustomTitleBar(ctk.CTkFrame):
     """
     Custom title bar to replace Windows default.
@@ -47,6 +65,12 @@ class CustomTitleBar(ctk.CTkFrame):
         self._drag_y = 0
         self._is_maximized = False
         self._normal_geometry = None
+        self._drag_target = None
+        self._drag_pending = False
+        self._drag_hwnd = None
+        self._last_api_state = None
+        # Resolve the close action once; the app window provides _on_close
+        self._close_cb = getattr(self.master, '_on_close', self.master.destroy)
         
         self._setup_ui()
         if self.draggable:
@@ -224,6 +248,11 @@ class CustomTitleBar(ctk.CTkFrame):
     def _on_drag_start(self, event):
         self._drag_x = event.x_root - self.master.winfo_x()
         self._drag_y = event.y_root - self.master.winfo_y()
+        if _user32 is not None:
+            try:
+                self._drag_hwnd = _user32.GetParent(self.master.winfo_id())
+            except Exception:
+                self._drag_hwnd = None
     
     def _on_drag_motion(self, event):
         if self._is_maximized:
@@ -231,9 +260,22 @@ class CustomTitleBar(ctk.CTkFrame):
             self._drag_x = self.master.winfo_width() // 2
             self._drag_y = 18
         
-        x = event.x_root - self._drag_x
-        y = event.y_root - self._drag_y
-        self.master.geometry(f"+{x}+{y}")
+        # Motion events can arrive far faster than the screen refreshes; only
+        # the latest position is applied, at most once per frame (~60 Hz)
+        self._drag_target = (event.x_root - self._drag_x, event.y_root - self._drag_y)
+        if not self._drag_pending:
+            self._drag_pending = True
+            self.after(16, self._flush_drag)
+    
+    def _flush_drag(self):
+        self._drag_pending = False
+        if self._drag_target:
+            x, y = self._drag_target
+            # Move the native window directly on Windows; Tk picks up the new
+            # position from the resulting move notification
+            if self._drag_hwnd and _user32.SetWindowPos(self._drag_hwnd, None, x, y, 0, 0, SWP_MOVE_ONLY):
+                return
+            self.master.geometry(f"+{x}+{y}")
     
     def _on_double_click(self, event):
         if not self.is_dialog:
@@ -241,8 +283,7 @@ class CustomTitleBar(ctk.CTkFrame):
     
     def _minimize_window(self):
         try:
-            hwnd = ctypes.windll.user32.GetParent(self.master.winfo_id())
-            ctypes.windll.user32.ShowWindow(hwnd, 6) # SW_MINIMIZE
+            _user32.ShowWindow(_user32.GetParent(self.master.winfo_id()), 6) # SW_MINIMIZE
         except Exception:
             try:
                 self.master.iconify()
@@ -273,14 +314,16 @@ class CustomTitleBar(ctk.CTkFrame):
                 self.max_btn.configure(text="□")
     
     def _close_window(self):
-        if hasattr(self.master, '_on_close'):
-            self.master._on_close()
-        else:
-            self.master.destroy()
+        self._close_cb()
     
     def set_api_status(self, is_valid: bool, model_name: str = "", connecting: bool = False):
-        if not hasattr(self, 'api_status'):
+        if self.is_dialog:  # Dialog title bars have no status labels
             return
+        # Status callbacks repeat often; skip the label redraw when nothing changed
+        state = (connecting, is_valid, model_name)
+        if state == self._last_api_state:
+            return
+        self._last_api_state = state
         if connecting:
             self.api_status.configure(text="⟳ Fetching models...", text_color=COLORS["text_secondary"])
         elif is_valid:
@@ -290,7 +333,7 @@ class CustomTitleBar(ctk.CTkFrame):
             self.api_status.configure(text="⚠ API Not Configured", text_color=COLORS["warning"])
             
     def set_active_prompt(self, name: str = ""):
-        if not hasattr(self, 'prompt_status'):
+        if self.is_dialog:
             return
         if name:
             self.prompt_status.configure(text=f"📝 {name}", text_color=COLORS["text_secondary"])
@@ -301,6 +344,22 @@ class CustomTitleBar(ctk.CTkFrame):
         return self.drag_area
 
 
+# Summary table rows as (icon, label); update_data fills the values by label
+_SUMMARY_ROW_SPEC = (
+    ("🤖", "Provider"),
+    ("🧠", "Model"),
+    ("💰", "Est. Cost"),
+    ("⏱️", "Duration"),
+    ("📝", "Lines"),
+    ("🗑️", "Cleaned"),
+)
+
+# Token stat columns ("Cached" is hidden unless the provider reported cache hits)
+_TOKEN_STAT_LABELS = ("Prompt", "Cached", "Completion", "Total")
+
+_format_count = "{:,}".format
+
+
 class SummaryWindow(ctk.CTkFrame):
     """
     Custom themed summary view for displaying translation results.
@@ -320,28 +379,25 @@ class SummaryWindow(ctk.CTkFrame):
         total_tokens: int,
         estimated_cost: Optional[float] = None,
         provider: str = "Unknown",
+        cached_prompt_tokens: int = 0,
         on_open_folder: Optional[Callable[[], None]] = None,
         on_close: Optional[Callable[[], None]] = None,
         **kwargs
     ):
         super().__init__(master, fg_color=COLORS["bg_dark"], **kwargs)
         
-        self.output_path = output_path
-        self.lines_translated = lines_translated
-        self.model_used = model_used
-        self.duration_seconds = duration_seconds
-        self.removed_old_subs = removed_old_subs
-        self.provider = provider
         self.on_open_folder = on_open_folder
         self.on_close_callback = on_close
         
-        self._setup_ui(
+        self._setup_ui()
+        self.update_data(
             output_path, lines_translated, model_used, duration_seconds,
             removed_old_subs, prompt_tokens, completion_tokens, total_tokens,
-            estimated_cost
+            estimated_cost, provider, cached_prompt_tokens,
+            on_open_folder=on_open_folder
         )
     
-    def _setup_ui(
+    def update_data(
         self,
         output_path: str,
         lines_translated: int,
@@ -351,8 +407,67 @@ class SummaryWindow(ctk.CTkFrame):
         prompt_tokens: int,
         completion_tokens: int,
         total_tokens: int,
-        estimated_cost: Optional[float] = None
+        estimated_cost: Optional[float] = None,
+        provider: str = "Unknown",
+        cached_prompt_tokens: int = 0,
+        on_open_folder: Optional[Callable[[], None]] = None
     ):
+        """Refresh the displayed results in place so the view can be reused."""
+        self.output_path = output_path
+        self._output_dir = str(Path(output_path).parent) if output_path else None
+        self.lines_translated = lines_translated
+        self.model_used = model_used
+        self.duration_seconds = duration_seconds
+        self.removed_old_subs = removed_old_subs
+        self.provider = provider
+        self.on_open_folder = on_open_folder
+        
+        # Format cost nicely if available
+        cost_value = "N/A"
+        if estimated_cost is not None:
+             if estimated_cost < 0.01:
+                cost_value = f"${estimated_cost:.6f}"
+             elif estimated_cost < 1.0:
+                cost_value = f"${estimated_cost:.4f}"
+             else:
+                cost_value = f"${estimated_cost:.2f}"
+        
+        values = {
+            "Provider": self.provider.title(),
+            "Model": self.model_used,
+            "Est. Cost": cost_value,
+            "Duration": self._format_duration(self.duration_seconds),
+            "Lines": _format_count(self.lines_translated),
+            "Cleaned": "Yes" if self.removed_old_subs else "No",
+        }
+        for label, value in values.items():
+            self._summary_values[label].configure(text=value)
+        
+        # Cost row only applies to providers that report pricing
+        self._set_row_visible(self._summary_rows["Est. Cost"], estimated_cost is not None)
+        
+        token_values = (prompt_tokens, cached_prompt_tokens, completion_tokens, total_tokens)
+        for label, value in zip(_TOKEN_STAT_LABELS, token_values):
+            self._token_values[label].configure(text=_format_count(value))
+        self._set_row_visible([self._token_frames["Cached"]], bool(cached_prompt_tokens))
+        
+        self.path_label.configure(text=self._truncate_path(output_path))
+    
+    @staticmethod
+    def _truncate_path(path: str, limit: int = 60) -> str:
+        """Keep the tail of a long path, which holds the file name."""
+        return path if len(path) <= limit else "..." + path[-(limit - 3):]
+    
+    @staticmethod
+    def _set_row_visible(widgets: List[ctk.CTkBaseClass], visible: bool):
+        """Show or hide gridded widgets, keeping their grid options."""
+        for widget in widgets:
+            if visible:
+                widget.grid()
+            else:
+                widget.grid_remove()
+    
+    def _setup_ui(self):
         """Setup the summary view UI."""
         # 1. Header (Top)
         header_frame = ctk.CTkFrame(self, fg_color=COLORS["success_bg"], corner_radius=0, height=80)
@@ -389,33 +504,12 @@ class SummaryWindow(ctk.CTkFrame):
         summary_frame = ctk.CTkFrame(main_container, fg_color="transparent")
         summary_frame.pack(pady=SPACING["md"])
         
-        # Format cost nicely if available
-        cost_value = "N/A"
-        if estimated_cost is not None:
-             if estimated_cost < 0.01:
-                cost_value = f"${estimated_cost:.6f}"
-             elif estimated_cost < 1.0:
-                cost_value = f"${estimated_cost:.4f}"
-             else:
-                cost_value = f"${estimated_cost:.2f}"
-
-        summary_items = [
-            ("🤖", "Provider", self.provider.title()),
-            ("🧠", "Model", self.model_used),
-        ]
-        
-        # Add cost if applicable
-        if estimated_cost is not None:
-            summary_items.append(("💰", "Est. Cost", cost_value))
-
-        summary_items.extend([
-            ("⏱️", "Duration", self._format_duration(self.duration_seconds)),
-            ("📝", "Lines", f"{self.lines_translated:,}"),
-            ("🗑️", "Cleaned", "Yes" if self.removed_old_subs else "No")
-        ])
-        
-        for i, (icon, label, value) in enumerate(summary_items):
-            self._create_summary_row(summary_frame, i, icon, label, value)
+        self._summary_rows = {}
+        self._summary_values = {}
+        for i, (icon, label) in enumerate(_SUMMARY_ROW_SPEC):
+            row_widgets = self._create_summary_row(summary_frame, i, icon, label, "")
+            self._summary_rows[label] = row_widgets
+            self._summary_values[label] = row_widgets[-1]
             
         # Separator
         separator = ctk.CTkFrame(main_container, fg_color=COLORS["border"], height=1)
@@ -434,22 +528,18 @@ class SummaryWindow(ctk.CTkFrame):
         
         token_frame = ctk.CTkFrame(token_section, fg_color=COLORS["bg_medium"], corner_radius=RADIUS["md"])
         token_frame.pack()
-        token_frame.grid_columnconfigure((0, 1, 2), weight=1)
+        token_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
         
         # Token stats
-        token_stats = [
-            ("Prompt", prompt_tokens),
-            ("Completion", completion_tokens),
-            ("Total", total_tokens),
-        ]
-        
-        for i, (label, value) in enumerate(token_stats):
+        self._token_frames = {}
+        self._token_values = {}
+        for i, label in enumerate(_TOKEN_STAT_LABELS):
             stat_frame = ctk.CTkFrame(token_frame, fg_color="transparent")
             stat_frame.grid(row=0, column=i, padx=SPACING["lg"], pady=SPACING["md"])
             
             value_label = ctk.CTkLabel(
                 stat_frame,
-                text=f"{value:,}",
+                text="0",
                 font=(FONTS["family"], FONTS["subheading_size"], "bold"),
                 text_color=COLORS["primary_light"]
             )
@@ -461,6 +551,8 @@ class SummaryWindow(ctk.CTkFrame):
                 **get_label_style("muted")
             )
             name_label.pack()
+            self._token_frames[label] = stat_frame
+            self._token_values[label] = value_label
         
         # Output path
         output_section = ctk.CTkFrame(main_container, fg_color="transparent")
@@ -476,19 +568,14 @@ class SummaryWindow(ctk.CTkFrame):
         output_frame = ctk.CTkFrame(output_section, fg_color=COLORS["bg_medium"], corner_radius=RADIUS["md"])
         output_frame.pack(fill="x")
         
-        # Truncate path if too long
-        display_path = output_path
-        if len(display_path) > 60:
-            display_path = "..." + display_path[-57:]
-        
-        path_label = ctk.CTkLabel(
+        self.path_label = ctk.CTkLabel(
             output_frame,
-            text=display_path,
+            text="",
             font=(FONTS["mono_family"], FONTS["small_size"]),
             text_color=COLORS["text_secondary"],
             wraplength=500
         )
-        path_label.pack(pady=SPACING["sm"], padx=SPACING["md"])
+        self.path_label.pack(pady=SPACING["sm"], padx=SPACING["md"])
         
         # 3. Footer (Buttons)
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -519,7 +606,7 @@ class SummaryWindow(ctk.CTkFrame):
         close_btn.pack(side="left", padx=SPACING["sm"])
     
     def _create_summary_row(self, parent, row: int, icon: str, label: str, value: str):
-        """Create a summary row with icon, label, and value."""
+        """Create a summary row with icon, label, and value. Returns the row widgets."""
         icon_label = ctk.CTkLabel(
             parent,
             text=icon,
@@ -544,30 +631,26 @@ class SummaryWindow(ctk.CTkFrame):
             anchor="e"
         )
         value_widget.grid(row=row, column=2, sticky="e", pady=SPACING["xs"])
+        return [icon_label, label_widget, value_widget]
     
-    def _format_duration(self, seconds: float) -> str:
+    @staticmethod
+    def _format_duration(seconds: float) -> str:
         """Format duration in seconds to human readable string."""
         if seconds < 60:
             return f"{seconds:.1f} seconds"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
+        if minutes < 60:
             return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m"
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}h {minutes}m"
     
     def _open_folder(self):
         """Open the output folder."""
         if self.on_open_folder:
             self.on_open_folder()
-        else:
-            import os
-            try:
-                os.startfile(Path(self.output_path).parent)
-            except Exception:
-                pass
+        elif self._output_dir:
+            from ..window_utils import open_folder
+            open_folder(self._output_dir)
         self._close()
         
     def _close(self):
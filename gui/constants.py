@@ -8,6 +8,7 @@ APP_TITLE = "sub-auto"
 APP_VERSION = f"v{__version__}"
 WINDOW_SIZE = (1200, 800)
 MIN_SIZE = (1200, 800)
+FOOTER_HEIGHT = 60
 
 # Language mapping from ISO 639-2 (MKVToolnix) to human names
 LANGUAGE_MAPPING = {
@@ -1,4 +1,5 @@
 import threading
+import time
 from typing import Callable, Optional, List
 from core.translator import get_api_manager
 from core.config_manager import ConfigManager
@@ -8,6 +9,9 @@ from gui.styles import COLORS
 class APIController:
     """Controller for managing AI provider connections and model fetching."""
     
+    # Successful validations for an unchanged provider config are reused for this long
+    VALIDATE_COALESCE_SECONDS = 30
+    
     def __init__(self, state: AppState, config: ConfigManager, title_bar: any, toast: any):
         self.state = state
         self.config = config
@@ -18,6 +22,11 @@ class APIController:
         self.validate_btn = None
         self.after_func = None # App's .after() method for thread-safe UI updates
         
+        # Coalescing guard for repeated validation requests
+        self._last_validate_sig = None
+        self._last_validate_time = 0.0
+        self._last_validate_result = None
+        
     def set_ui_elements(self, dropdown, status, validate_btn, title_bar, after_func):
         self.model_dropdown = dropdown
         self.model_status = status
@@ -60,8 +69,29 @@ class APIController:
                 display_model = info.short_name
             self.title_bar.set_api_status(self.state.api_validated, display_model or "")
 
+    def _validate_signature(self) -> tuple:
+        """Provider settings that determine the outcome of a validation."""
+        return (
+            self.config.provider,
+            self.config.openrouter_api_key,
+            self.config.groq_api_key,
+            self.config.ollama_base_url,
+        )
+
     def validate_api(self):
         """Validate AI provider connection in background."""
+        # A validation is already in flight; its result will update the UI
+        if self.state.is_validating:
+            return
+        
+        # Reuse a recent successful result if the provider config is unchanged
+        sig = self._validate_signature()
+        if (self._last_validate_result is not None
+                and sig == self._last_validate_sig
+                and time.monotonic() - self._last_validate_time < self.VALIDATE_COALESCE_SECONDS):
+            self._on_validate_result(self._last_validate_result)
+            return
+        
         if self.validate_btn:
             self.validate_btn.configure(state="disabled", text="...")
         if self.model_status:
@@ -72,17 +102,23 @@ class APIController:
         self.title_bar.set_api_status(False, connecting=True)
         self.state.is_validating = True
         
-        thread = threading.Thread(target=self._do_validate, daemon=True)
+        thread = threading.Thread(target=self._do_validate, args=(sig,), daemon=True)
         thread.start()
 
-    def _do_validate(self):
+    def _do_validate(self, sig: tuple):
         """Internal validation thread worker."""
         try:
             manager = get_api_manager()
             result = manager.validate_connection()
+            self._last_validate_sig = sig
+            self._last_validate_time = time.monotonic()
+            self._last_validate_result = result if result.is_valid else None
             if self.after_func:
                 self.after_func(0, lambda: self._on_validate_result(result))
         except Exception as e:
+            self._last_validate_sig = sig
+            self._last_validate_time = time.monotonic()
+            self._last_validate_result = None
             if self.after_func:
                 self.after_func(0, lambda e=e: self._on_validate_error(str(e)))
 
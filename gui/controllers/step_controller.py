@@ -45,8 +45,7 @@ class StepController:
         """Update stepper descriptions and completion marks."""
         # Step 1: File
         if self.state.current_file:
-            from pathlib import Path
-            self.stepper.update_step(1, description=Path(self.state.current_file).name, is_complete=True)
+            self.stepper.update_step(1, description=self.state.current_file_name, is_complete=True)
         else:
             self.stepper.update_step(1, description="Select MKV video file", is_complete=False)
 
@@ -74,6 +74,7 @@ class TranslationController:
             "removed_old_subs": summary.get("removed_old_subs", False),
             "prompt_tokens": tokens.prompt_tokens if tokens else 0,
             "completion_tokens": tokens.completion_tokens if tokens else 0,
+            "cached_prompt_tokens": tokens.cached_prompt_tokens if tokens else 0,
             "total_tokens": tokens.total_tokens if tokens else 0,
             "estimated_cost": summary.get("estimated_cost", 0),
             "provider": provider
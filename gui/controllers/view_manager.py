@@ -103,6 +103,6 @@ class ViewManager:
     def _open_folder(self, path: Optional[str]):
         """Helper to open folder in OS explorer."""
         if path:
-            import os
             from pathlib import Path
-            os.startfile(Path(path).parent)
+            from gui.window_utils import open_folder
+            open_folder(str(Path(path).parent))
@@ -7,6 +7,7 @@ import customtkinter as ctk
 from pathlib import Path
 from typing import Optional, List, Callable, Dict
 from datetime import datetime
+from tkinter import messagebox
 
 from .styles import (
     COLORS, FONTS, SPACING, RADIUS,
@@ -378,7 +379,6 @@ class HistoryView(ctk.CTkFrame):
         self._on_item_select("", False)
         
     def _clear_all(self):
-        from tkinter import messagebox
         if messagebox.askyesno("Clear All History", "Are you sure you want to delete ALL history entries?"):
             self.history_manager.clear_all()
             self.selected_ids.clear()
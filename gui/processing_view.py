@@ -16,6 +16,8 @@ class ProcessingView(ctk.CTkFrame):
     Shows progress, stats, and control buttons.
     """
     
+    PROGRESS_FLUSH_MS = 100  # Progress updates are coalesced into one redraw per interval
+    
     def __init__(
         self,
         master,
@@ -31,6 +33,11 @@ class ProcessingView(ctk.CTkFrame):
         self.on_cancel = on_cancel
         self.is_paused = False
         
+        # Latest progress waiting to be drawn, and what is currently shown
+        self._pending_progress: Optional[tuple] = None
+        self._flush_job = None
+        self._last_status: Optional[tuple] = None
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -174,43 +181,46 @@ class ProcessingView(ctk.CTkFrame):
         self.progress_bar.set(percent / 100)
         self.percent_label.configure(text=f"{percent:.0f}%")
         self.lines_label.configure(text=f"{current:,} / {total:,} lines")
-        # Force UI refresh to ensure progress updates are visible immediately
-        self.update_idletasks()
     
     def set_token_stats(self, prompt: int, completion: int, total: int):
         """Update token statistics."""
         self.prompt_value_label.configure(text=f"{prompt:,}")
         self.completion_value_label.configure(text=f"{completion:,}")
         self.total_value_label.configure(text=f"{total:,}")
-        # Force UI refresh to ensure token stats are visible immediately
-        self.update_idletasks()
     
     def set_status(self, text: str, color: Optional[str] = None):
-        """Update status label."""
-        self.status_label.configure(text=text)
+        """Update status label, skipping the redraw if nothing changed."""
+        if (text, color) == self._last_status:
+            return
+        self._last_status = (text, color)
         if color:
-            self.status_label.configure(text_color=color)
+            self.status_label.configure(text=text, text_color=color)
+        else:
+            self.status_label.configure(text=text)
     
     def set_paused(self, paused: bool):
         """Set paused state."""
         self.is_paused = paused
+        self._flush_progress()
         if paused:
-            self.status_label.configure(text="⏸️ Paused", text_color=COLORS["warning"])
+            self.set_status("⏸️ Paused", COLORS["warning"])
             self.progress_bar.configure(progress_color=COLORS["warning"])
         else:
-            self.status_label.configure(text="🔄 Translating...", text_color=COLORS["info"])
+            self.set_status("🔄 Translating...", COLORS["info"])
             self.progress_bar.configure(progress_color=COLORS["info"])
             # self.card.configure(border_color=COLORS["info"])
 
     def set_completed(self):
         """Set completed state."""
-        self.status_label.configure(text="✅ Complete!", text_color=COLORS["success"])
+        self._flush_progress()
+        self.set_status("✅ Complete!", COLORS["success"])
         self.progress_bar.configure(progress_color=COLORS["success"])
         # self.card.configure(border_color=COLORS["success"])
 
     def set_error(self, message: str):
         """Set error state."""
-        self.status_label.configure(text=f"❌ Error: {message}", text_color=COLORS["error"])
+        self._flush_progress()
+        self.set_status(f"❌ Error: {message}", COLORS["error"])
         self.progress_bar.configure(progress_color=COLORS["error"])
         # self.card.configure(border_color=COLORS["error"])
 
@@ -222,12 +232,37 @@ class ProcessingView(ctk.CTkFrame):
         status_color: Optional[str] = None,
         tokens: Optional[Any] = None
     ):
-        """Unified method to update all progress aspects at once."""
+        """
+        Unified method to update all progress aspects at once.
+        
+        Updates are buffered and drawn at most once per PROGRESS_FLUSH_MS;
+        a status without a newer replacement is kept until the next flush.
+        """
+        if not status and self._pending_progress:
+            status, status_color = self._pending_progress[2:4]
+        token_stats = (tokens.prompt_tokens, tokens.completion_tokens, tokens.total_tokens) if tokens else None
+        if token_stats is None and self._pending_progress:
+            token_stats = self._pending_progress[4]
+        self._pending_progress = (current, total, status, status_color, token_stats)
+        
+        if self._flush_job is None:
+            self._flush_job = self.after(self.PROGRESS_FLUSH_MS, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Draw the latest buffered progress update, if any."""
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        if self._pending_progress is None:
+            return
+        current, total, status, status_color, token_stats = self._pending_progress
+        self._pending_progress = None
+        
         percent = (current / total * 100) if total > 0 else 0
         self.set_progress(percent, current, total)
         
         if status:
             self.set_status(status, status_color)
             
-        if tokens:
-            self.set_token_stats(tokens.prompt_tokens, tokens.completion_tokens, tokens.total_tokens)
+        if token_stats:
+            self.set_token_stats(*token_stats)
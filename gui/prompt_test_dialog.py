@@ -5,6 +5,7 @@ Allows testing prompts with sample input.
 
 import customtkinter as ctk
 import threading
+from typing import List
 
 from .styles import COLORS, FONTS, SPACING, RADIUS, get_button_style, get_input_style, get_label_style
 from core.translator import Translator
@@ -169,12 +170,12 @@ class PromptTestDialog(ctk.CTkToplevel):
     def _on_test(self):
         """Run the test translation."""
         # Get input
-        input_text = self.input_text.get("1.0", "end-1c").strip()
+        sample_lines = self._nonblank_lines(self.input_text)
         context_text = self.context_text.get("1.0", "end-1c").strip()
         source_lang = self.source_lang.get().strip()
         target_lang = self.target_lang.get().strip()
         
-        if not input_text:
+        if not sample_lines:
             self.status_label.configure(text="❌ Please enter sample text", text_color=COLORS["error"])
             return
         
@@ -182,18 +183,18 @@ class PromptTestDialog(ctk.CTkToplevel):
         self.test_btn.configure(state="disabled", text="Testing...")
         self.status_label.configure(text="⏳ Translating...", text_color=COLORS["text_secondary"])
 
-        preview = self._render_preview(input_text, source_lang, target_lang, context_text)
+        preview = self._render_preview(sample_lines, source_lang, target_lang, context_text)
         self._set_preview_text(preview)
         
         # Run in background
         thread = threading.Thread(
             target=self._do_test,
-            args=(input_text, source_lang, target_lang, context_text),
+            args=(sample_lines, source_lang, target_lang, context_text),
             daemon=True
         )
         thread.start()
     
-    def _do_test(self, input_text: str, source_lang: str, target_lang: str, context_text: str):
+    def _do_test(self, sample_lines: List[str], source_lang: str, target_lang: str, context_text: str):
         """Perform the test translation in background."""
         try:
             # Create a temporary translator with custom prompt
@@ -246,7 +247,7 @@ class PromptTestDialog(ctk.CTkToplevel):
                     text=line,
                     style=""
                 )
-                for i, line in enumerate([line.strip() for line in input_text.splitlines() if line.strip()], start=1)
+                for i, line in enumerate(sample_lines, start=1)
             ]
 
             context_lines = [
@@ -257,7 +258,8 @@ class PromptTestDialog(ctk.CTkToplevel):
                     text=line.replace("[PREV]", "").strip(),
                     style=""
                 )
-                for i, line in enumerate([line.strip() for line in context_text.splitlines() if line.strip()], start=1)
+                # Strip each line once; empty results drop out of the filter
+                for i, line in enumerate(filter(None, map(str.strip, context_text.splitlines())), start=1)
             ]
             
             # Translate
@@ -293,10 +295,9 @@ class PromptTestDialog(ctk.CTkToplevel):
         else:
             self.status_label.configure(text=f"❌ Error: {error}", text_color=COLORS["error"])
 
-    def _render_preview(self, input_text: str, source_lang: str, target_lang: str, context_text: str) -> str:
+    def _render_preview(self, sample_lines: List[str], source_lang: str, target_lang: str, context_text: str) -> str:
         """Render the final prompt with current sample values."""
-        lines = [line.strip() for line in input_text.splitlines() if line.strip()]
-        rendered_lines = "\n".join(f"[{i}] {line}" for i, line in enumerate(lines, start=1)) or "[1] Hello world"
+        rendered_lines = "\n".join(f"[{i}] {line}" for i, line in enumerate(sample_lines, start=1)) or "[1] Hello world"
         rendered_context = context_text or "(No previous context)"
 
         temp_prompt = Prompt(
@@ -319,6 +320,11 @@ class PromptTestDialog(ctk.CTkToplevel):
             "lines": rendered_lines
         })
 
+    @staticmethod
+    def _nonblank_lines(textbox) -> List[str]:
+        """Stripped, non-empty lines of a textbox."""
+        return [line for line in map(str.strip, textbox.get("1.0", "end-1c").splitlines()) if line]
+
     def _set_preview_text(self, text: str):
         """Replace rendered preview content safely."""
         self.preview_text.configure(state="normal")
@@ -1,4 +1,5 @@
-from typing import List, Optional, Callable
+import os
+from typing import List, Optional, Callable, Dict, Tuple
 from core.mkv_handler import MKVHandler, SubtitleTrack
 from gui.state.app_state import AppState
 from gui.styles import COLORS
@@ -6,23 +7,47 @@ from gui.styles import COLORS
 class SubtitleTrackService:
     """Service for managing subtitle tracks from MKV files."""
     
+    TRACK_CACHE_SIZE = 16
+    
     def __init__(self, mkv_handler: MKVHandler, state: AppState):
         self.mkv_handler = mkv_handler
         self.state = state
         self.language_mapping = {} # Will be set by app
+        # path -> ((mtime, size), supported tracks); re-probed when the file changes
+        self._track_cache: Dict[str, Tuple[Tuple[float, int], List[SubtitleTrack]]] = {}
         
     def set_language_mapping(self, mapping: dict):
         self.language_mapping = mapping
 
-    def load_tracks(self, file_path: str) -> List[SubtitleTrack]:
-        """Load and filter subtitle tracks from MKV."""
+    def load_tracks(self, file_path: str, stat_result: Optional[os.stat_result] = None) -> List[SubtitleTrack]:
+        """
+        Load and filter subtitle tracks from MKV.
+        
+        Args:
+            file_path: Path to the MKV file
+            stat_result: os.stat of file_path if the caller already has it
+        """
         if not self.mkv_handler or not file_path:
             return []
-            
-        tracks = self.mkv_handler.get_subtitle_tracks(file_path)
-        # Filter for supported formats
-        filtered = [t for t in tracks if t.file_extension in ['.srt', '.ass']]
+        
+        if stat_result is None:
+            stat_result = os.stat(file_path)
+        signature = (stat_result.st_mtime, stat_result.st_size)
+        
+        cached = self._track_cache.get(file_path)
+        if cached and cached[0] == signature:
+            filtered = list(cached[1])
+        else:
+            tracks = self.mkv_handler.get_subtitle_tracks(file_path)
+            # Filter for supported formats
+            filtered = [t for t in tracks if t.file_extension in ['.srt', '.ass']]
+            self._track_cache.pop(file_path, None)
+            if len(self._track_cache) >= self.TRACK_CACHE_SIZE:
+                self._track_cache.pop(next(iter(self._track_cache)))
+            self._track_cache[file_path] = (signature, list(filtered))
+        
         self.state.subtitle_tracks = filtered
+        self.state.tracks_by_id = {t.track_id: t for t in filtered}
         self.state.selected_track_id = None
         return filtered
 
@@ -46,7 +71,7 @@ class SubtitleTrackService:
 
     def get_track_language_name(self, track_id: int) -> Optional[str]:
         """Get human-readable language name for a track."""
-        track = next((t for t in self.state.subtitle_tracks if t.track_id == track_id), None)
+        track = self.state.tracks_by_id.get(track_id)
         if track and track.language:
             lang_code = track.language.lower()
             return self.language_mapping.get(lang_code)
@@ -1,5 +1,4 @@
 from core.mkv_handler import MKVHandler
-from core.translation_orchestrator import TranslationOrchestrator
 from gui.state.app_state import AppState
 
 class TranslationSession:
@@ -13,6 +12,8 @@ class TranslationSession:
     def init_orchestrator(self, on_progress, on_complete, on_error):
         """Initialize or get the orchestrator with callbacks."""
         if not self.orchestrator:
+            # Deferred so the translation pipeline loads on first use, not at startup
+            from core.translation_orchestrator import TranslationOrchestrator
             self.orchestrator = TranslationOrchestrator(self.mkv_handler)
             
         self.orchestrator.set_callbacks(
@@ -22,13 +23,13 @@ class TranslationSession:
         )
         return self.orchestrator
 
-    def start(self, file_path, track_id, source_lang, target_lang, model, anime_title, external_subtitle_path=None):
-        """Start a new translation."""
+    def start(self, file_path, track_id, source_lang, target_lang, model, anime_title, external_subtitle_path=None) -> bool:
+        """Start a new translation. Returns False if one is already running."""
         if not self.orchestrator:
             raise RuntimeError("Orchestrator not initialized")
             
         self.state.is_processing = True
-        self.orchestrator.start_translation(
+        return self.orchestrator.start_translation(
             file_path, track_id, source_lang, target_lang, model, anime_title, external_subtitle_path
         )
 
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional, List, Set, Any, Dict
 from core.mkv_handler import SubtitleTrack
 from core.translator import Translator
@@ -7,7 +8,9 @@ from core.translator import Translator
 class AppState:
     """Central data container for SubAutoApp state."""
     current_file: Optional[str] = None
+    current_file_name: Optional[str] = None
     subtitle_tracks: List[SubtitleTrack] = field(default_factory=list)
+    tracks_by_id: Dict[int, SubtitleTrack] = field(default_factory=dict)
     selected_track_id: Optional[int] = None
     external_subtitle_path: Optional[str] = None
     api_validated: bool = False
@@ -26,3 +29,8 @@ class AppState:
     
     # Payload for review step
     merge_payload: Optional[Dict[str, Any]] = None
+
+    def set_current_file(self, file_path: Optional[str]):
+        """Set the current file and cache its display name."""
+        self.current_file = file_path
+        self.current_file_name = Path(file_path).name if file_path else None
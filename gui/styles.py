@@ -99,117 +99,144 @@ def configure_theme():
     ctk.set_default_color_theme("blue")
 
 
+_BUTTON_STYLES = {
+    "primary": {
+        "fg_color": COLORS["primary"],
+        "hover_color": COLORS["primary_hover"],
+        "text_color": "#0f1419",
+        "corner_radius": RADIUS["md"],
+    },
+    "secondary": {
+        "fg_color": COLORS["bg_light"],
+        "hover_color": COLORS["border_light"],
+        "text_color": COLORS["text_primary"],
+        "corner_radius": RADIUS["md"],
+    },
+    "success": {
+        "fg_color": COLORS["success"],
+        "hover_color": COLORS["success_bg"],
+        "text_color": "#0f1419",
+        "corner_radius": RADIUS["md"],
+    },
+    "danger": {
+        "fg_color": COLORS["error"],
+        "hover_color": COLORS["error_bg"],
+        "text_color": COLORS["text_primary"],
+        "corner_radius": RADIUS["md"],
+    },
+    "ghost": {
+        "fg_color": "transparent",
+        "hover_color": COLORS["bg_light"],
+        "text_color": COLORS["text_secondary"],
+        "corner_radius": RADIUS["md"],
+    },
+    "info": {
+        "fg_color": COLORS["info"],
+        "hover_color": COLORS["info_bg"],
+        "text_color": "#f7fbff",
+        "corner_radius": RADIUS["md"],
+    },
+}
+
+
 def get_button_style(variant: str = "primary") -> dict:
     """Get button styling based on variant."""
-    styles = {
-        "primary": {
-            "fg_color": COLORS["primary"],
-            "hover_color": COLORS["primary_hover"],
-            "text_color": "#0f1419",
-            "corner_radius": RADIUS["md"],
-        },
-        "secondary": {
-            "fg_color": COLORS["bg_light"],
-            "hover_color": COLORS["border_light"],
-            "text_color": COLORS["text_primary"],
-            "corner_radius": RADIUS["md"],
-        },
-        "success": {
-            "fg_color": COLORS["success"],
-            "hover_color": COLORS["success_bg"],
-            "text_color": "#0f1419",
-            "corner_radius": RADIUS["md"],
-        },
-        "danger": {
-            "fg_color": COLORS["error"],
-            "hover_color": COLORS["error_bg"],
-            "text_color": COLORS["text_primary"],
-            "corner_radius": RADIUS["md"],
-        },
-        "ghost": {
-            "fg_color": "transparent",
-            "hover_color": COLORS["bg_light"],
-            "text_color": COLORS["text_secondary"],
-            "corner_radius": RADIUS["md"],
-        },
-        "info": {
-            "fg_color": COLORS["info"],
-            "hover_color": COLORS["info_bg"],
-            "text_color": "#f7fbff",
-            "corner_radius": RADIUS["md"],
-        },
-    }
-    return styles.get(variant, styles["primary"])
+    return _BUTTON_STYLES.get(variant, _BUTTON_STYLES["primary"])
+
+
+_INPUT_STYLE = {
+    "fg_color": COLORS["bg_dark"],
+    "border_color": COLORS["border"],
+    "text_color": COLORS["text_primary"],
+    "placeholder_text_color": COLORS["text_muted"],
+    "corner_radius": RADIUS["md"],
+    "border_width": 1,
+}
 
 
 def get_input_style() -> dict:
     """Get input field styling."""
-    return {
-        "fg_color": COLORS["bg_dark"],
-        "border_color": COLORS["border"],
-        "text_color": COLORS["text_primary"],
-        "placeholder_text_color": COLORS["text_muted"],
-        "corner_radius": RADIUS["md"],
-        "border_width": 1,
-    }
+    return _INPUT_STYLE
+
+
+_OPTION_MENU_STYLE = {
+    "fg_color": COLORS["bg_dark"],
+    "button_color": COLORS["bg_medium"],
+    "button_hover_color": COLORS["primary_hover"],
+    "text_color": COLORS["text_primary"],
+    "corner_radius": RADIUS["md"],
+}
 
 
 def get_option_menu_style() -> dict:
     """Get option menu styling."""
-    return {
-        "fg_color": COLORS["bg_dark"],
-        "button_color": COLORS["bg_medium"],
-        "button_hover_color": COLORS["primary_hover"],
-        "text_color": COLORS["text_primary"],
-        "corner_radius": RADIUS["md"],
-    }
+    return _OPTION_MENU_STYLE
+
+
+_DROPDOWN_STYLE = {
+    "fg_color": COLORS["bg_dark"],
+    "button_color": COLORS["bg_light"],
+    "button_hover_color": COLORS["border"],
+    "dropdown_fg_color": COLORS["bg_dark"],
+    "dropdown_hover_color": COLORS["bg_light"],
+    "corner_radius": RADIUS["md"],
+}
+
+
+def get_dropdown_style() -> dict:
+    """Get styling for option menus used as in-card dropdowns."""
+    return _DROPDOWN_STYLE
+
+
+_FRAME_STYLES = {
+    "default": {
+        "fg_color": COLORS["bg_medium"],
+        "corner_radius": RADIUS["lg"],
+    },
+    "card": {
+        "fg_color": COLORS["bg_medium"],
+        "corner_radius": RADIUS["lg"],
+    },
+    "transparent": {
+        "fg_color": "transparent",
+        "corner_radius": 0,
+    },
+}
 
 
 def get_frame_style(variant: str = "default") -> dict:
     """Get frame styling based on variant."""
-    styles = {
-        "default": {
-            "fg_color": COLORS["bg_medium"],
-            "corner_radius": RADIUS["lg"],
-        },
-        "card": {
-            "fg_color": COLORS["bg_medium"],
-            "corner_radius": RADIUS["lg"],
-        },
-        "transparent": {
-            "fg_color": "transparent",
-            "corner_radius": 0,
-        },
-    }
-    return styles.get(variant, styles["default"])
+    return _FRAME_STYLES.get(variant, _FRAME_STYLES["default"])
+
+
+_LABEL_STYLES = {
+    "heading": {
+        "text_color": COLORS["text_primary"],
+        "font": (FONTS["family"], FONTS["heading_size"], "bold"),
+    },
+    "subheading": {
+        "text_color": COLORS["text_primary"],
+        "font": (FONTS["family"], FONTS["subheading_size"], "bold"),
+    },
+    "body": {
+        "text_color": COLORS["text_primary"],
+        "font": (FONTS["family"], FONTS["body_size"]),
+    },
+    "secondary": {
+        "text_color": COLORS["text_secondary"],
+        "font": (FONTS["family"], FONTS["body_size"]),
+    },
+    "muted": {
+        "text_color": COLORS["text_muted"],
+        "font": (FONTS["family"], FONTS["small_size"]),
+    },
+    "mono": {
+        "text_color": COLORS["text_secondary"],
+        "font": (FONTS["mono_family"], FONTS["small_size"]),
+    },
+}
 
 
 def get_label_style(variant: str = "body") -> dict:
     """Get label styling based on variant."""
-    styles = {
-        "heading": {
-            "text_color": COLORS["text_primary"],
-            "font": (FONTS["family"], FONTS["heading_size"], "bold"),
-        },
-        "subheading": {
-            "text_color": COLORS["text_primary"],
-            "font": (FONTS["family"], FONTS["subheading_size"], "bold"),
-        },
-        "body": {
-            "text_color": COLORS["text_primary"],
-            "font": (FONTS["family"], FONTS["body_size"]),
-        },
-        "secondary": {
-            "text_color": COLORS["text_secondary"],
-            "font": (FONTS["family"], FONTS["body_size"]),
-        },
-        "muted": {
-            "text_color": COLORS["text_muted"],
-            "font": (FONTS["family"], FONTS["small_size"]),
-        },
-        "mono": {
-            "text_color": COLORS["text_secondary"],
-            "font": (FONTS["mono_family"], FONTS["small_size"]),
-        },
-    }
-    return styles.get(variant, styles["body"])
+    return _LABEL_STYLES.get(variant, _LABEL_STYLES["body"])
@@ -2,16 +2,19 @@
 
 import re
 import tkinter as tk
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from tkinter import messagebox
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 
 from core.subtitle_parser import SubtitleParser
 from .styles import COLORS, FONTS, SPACING, get_button_style, get_label_style
 
+# ASS override blocks such as {\i1} are hidden from previews and validation
+_OVERRIDE_TAG_PATTERN = re.compile(r"\{[^}]*\}")
+
 
 @dataclass
 class ReviewEntry:
@@ -26,6 +29,11 @@ class ReviewEntry:
     original_text: str
     original_start_ms: int
     original_end_ms: int
+    # Source text never changes during review, so its search key is built once
+    source_search: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.source_search = self.source_text.lower()
 
     @property
     def modified(self) -> bool:
@@ -45,7 +53,9 @@ class ReviewEntry:
 
     @property
     def clean_preview(self) -> str:
-        text = re.sub(r"\{[^}]*\}", "", self.text)
+        text = self.text
+        if "{" in text:
+            text = _OVERRIDE_TAG_PATTERN.sub("", text)
         return text.replace(r"\N", " ").replace("\n", " ").strip()
 
 
@@ -74,6 +84,9 @@ class ReviewDocument:
             for issue in (translation_issues or [])
             if issue.get("entry_index") is not None
         }
+        # Issues per entry position; an entry's issues depend only on itself and
+        # the entry before it, so edits invalidate just those two slots
+        self._issue_cache: Dict[int, List[ReviewIssue]] = {}
 
         for position, line in enumerate(translated_lines):
             source_text = (
@@ -108,7 +121,20 @@ class ReviewDocument:
     def dirty(self) -> bool:
         return any(entry.modified for entry in self.entries)
 
+    def invalidate(self, entry: ReviewEntry):
+        """Drop cached issues affected by an edit to entry."""
+        position = entry.display_number - 1
+        self._issue_cache.pop(position, None)
+        self._issue_cache.pop(position + 1, None)
+
     def issues_for(self, entry: ReviewEntry) -> List[ReviewIssue]:
+        position = entry.display_number - 1
+        issues = self._issue_cache.get(position)
+        if issues is None:
+            issues = self._issue_cache[position] = self._compute_issues(entry)
+        return issues
+
+    def _compute_issues(self, entry: ReviewEntry) -> List[ReviewIssue]:
         issues: List[ReviewIssue] = []
         text = entry.clean_preview
 
@@ -169,7 +195,7 @@ class ReviewDocument:
 class SubtitleReviewPanel(ctk.CTkFrame):
     """One focused editor for reviewing text and timing before merge."""
 
-    TIME_PATTERN = re.compile(r"^(\d{2}):(\d{2}):(\d{2})[,.](\d{3})$")
+    EDIT_REFRESH_MS = 150  # Typing bursts shorter than this share one list/summary refresh
 
     def __init__(
         self,
@@ -179,24 +205,49 @@ class SubtitleReviewPanel(ctk.CTkFrame):
         on_discard: Callable[[], None],
         source_path: Optional[str] = None,
         translation_issues: Optional[List[dict]] = None,
+        document: Optional[ReviewDocument] = None,
         **kwargs,
     ):
         super().__init__(master, fg_color="transparent", **kwargs)
         self.on_approve = on_approve
         self.on_discard = on_discard
-        self.document = ReviewDocument(subtitle_path, source_path, translation_issues)
+        # Callers may parse the document ahead of time (e.g. off the Tk thread)
+        self.document = document or ReviewDocument(subtitle_path, source_path, translation_issues)
         self.filtered_entries: List[ReviewEntry] = list(self.document.entries)
+        # display_number -> listbox row of filtered_entries, rebuilt by _refresh_list
+        self._row_index: Dict[int, int] = {}
         self.current_entry: Optional[ReviewEntry] = None
         self.filter_value = "All"
         self._loading_entry = False
         self._merge_in_progress = False
+        self._edit_refresh_job = None
 
         self._setup_ui()
+        self._show_document()
+
+    def load_document(self, document: ReviewDocument):
+        """Review a new document, reusing this panel's widgets."""
+        if self._edit_refresh_job is not None:
+            self.after_cancel(self._edit_refresh_job)
+            self._edit_refresh_job = None
+        self.document = document
+        self.filtered_entries = list(document.entries)
+        self._row_index = {}
+        self.current_entry = None
+        if self._merge_in_progress:
+            self.end_merge()
+        self.search_entry.delete(0, "end")
+        self._show_document()
+
+    def _show_document(self):
+        """Open the document on its issues if it has any, otherwise on the first entry."""
         self._update_summary()
         if self.document.validate():
             self.filter_control.set("Issues")
             self._set_filter("Issues")
         else:
+            self.filter_control.set("All")
+            self.filter_value = "All"
             self._refresh_list(select_entry=self.filtered_entries[0] if self.filtered_entries else None)
 
     def _setup_ui(self):
@@ -402,12 +453,20 @@ class SubtitleReviewPanel(ctk.CTkFrame):
         seconds, millis = divmod(remainder, 1000)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
 
-    @classmethod
-    def _parse_time(cls, value: str) -> int:
-        match = cls.TIME_PATTERN.fullmatch(value.strip())
-        if not match:
+    @staticmethod
+    def _parse_time(value: str) -> int:
+        # Fixed-width HH:MM:SS,mmm (or .mmm) is checked by position, no regex needed
+        value = value.strip()
+        if not (
+            len(value) == 12
+            and value[2] == ":" and value[5] == ":" and value[8] in ",."
+            and value[0:2].isdecimal() and value[3:5].isdecimal()
+            and value[6:8].isdecimal() and value[9:12].isdecimal()
+        ):
             raise ValueError("Use HH:MM:SS,mmm")
-        hours, minutes, seconds, millis = map(int, match.groups())
+        hours, minutes, seconds, millis = (
+            int(value[0:2]), int(value[3:5]), int(value[6:8]), int(value[9:12])
+        )
         if minutes > 59 or seconds > 59:
             raise ValueError("Minutes and seconds must be below 60")
         return ((hours * 60 + minutes) * 60 + seconds) * 1000 + millis
@@ -426,7 +485,7 @@ class SubtitleReviewPanel(ctk.CTkFrame):
         if query:
             entries = [
                 entry for entry in entries
-                if query in entry.text.lower() or query in entry.source_text.lower()
+                if query in entry.source_search or query in entry.text.lower()
             ]
         if self.filter_value == "Issues":
             issue_numbers = {issue.entry_number for issue in self.document.validate()}
@@ -434,33 +493,51 @@ class SubtitleReviewPanel(ctk.CTkFrame):
         elif self.filter_value == "Edited":
             entries = [entry for entry in entries if entry.modified]
 
+        if (
+            self._row_of(self.current_entry) is not None
+            and len(entries) == len(self.filtered_entries)
+            and all(new is old for new, old in zip(entries, self.filtered_entries))
+        ):
+            # Same rows as before: only the edited row and the one after it can have changed
+            self._redraw_current_row()
+            return
+
         self.filtered_entries = entries
         selected = self.current_entry if self.current_entry in entries else (entries[0] if entries else None)
         self._refresh_list(select_entry=selected)
 
-    def _row_text(self, entry: ReviewEntry) -> str:
+    def _row_display(self, entry: ReviewEntry) -> Tuple[str, Optional[str]]:
+        """Return the list row text and its highlight color (None for the default)."""
         issues = self.document.issues_for(entry)
         if any(issue.severity == "error" for issue in issues):
-            marker = "E"
+            marker, color = "E", COLORS["error"]
         elif issues:
-            marker = "W"
+            marker, color = "W", COLORS["warning"]
         else:
-            marker = "*" if entry.modified else " "
+            marker, color = ("*" if entry.modified else " "), None
         preview = entry.clean_preview[:54]
-        return f"{marker} {entry.display_number:04d}  {self._format_time(entry.start_ms)}  {preview}"
+        return f"{marker} {entry.display_number:04d}  {self._format_time(entry.start_ms)}  {preview}", color
+
+    def _row_of(self, entry: Optional[ReviewEntry]) -> Optional[int]:
+        """Listbox row showing entry, or None if it is filtered out."""
+        if entry is None:
+            return None
+        return self._row_index.get(entry.display_number)
 
     def _refresh_list(self, select_entry: Optional[ReviewEntry] = None):
+        self._row_index = {
+            entry.display_number: index for index, entry in enumerate(self.filtered_entries)
+        }
+        rows = [self._row_display(entry) for entry in self.filtered_entries]
         self.listbox.delete(0, "end")
-        for index, entry in enumerate(self.filtered_entries):
-            self.listbox.insert("end", self._row_text(entry))
-            issues = self.document.issues_for(entry)
-            if any(issue.severity == "error" for issue in issues):
-                self.listbox.itemconfig(index, foreground=COLORS["error"])
-            elif issues:
-                self.listbox.itemconfig(index, foreground=COLORS["warning"])
-
-        if select_entry and select_entry in self.filtered_entries:
-            index = self.filtered_entries.index(select_entry)
+        # One insert call for every row, then color only the flagged ones
+        self.listbox.insert("end", *(text for text, _ in rows))
+        for index, (_, color) in enumerate(rows):
+            if color:
+                self.listbox.itemconfig(index, foreground=color)
+
+        index = self._row_of(select_entry)
+        if index is not None:
             self.listbox.selection_set(index)
             self.listbox.activate(index)
             self.listbox.see(index)
@@ -475,6 +552,15 @@ class SubtitleReviewPanel(ctk.CTkFrame):
             self._select_entry(self.filtered_entries[selection[0]])
 
     def _select_entry(self, entry: ReviewEntry):
+        if self._edit_refresh_job is not None:
+            # Switching away mid-burst: settle the previous entry's row and the
+            # summary without refiltering underneath the new selection
+            self.after_cancel(self._edit_refresh_job)
+            self._edit_refresh_job = None
+            self._update_summary()
+            index = self._row_of(self.current_entry)
+            if index is not None:
+                self._draw_row(index, self.current_entry)
         self.current_entry = entry
         self._loading_entry = True
         try:
@@ -505,7 +591,17 @@ class SubtitleReviewPanel(ctk.CTkFrame):
     def _on_text_changed(self, _event=None):
         if self._loading_entry or not self.current_entry:
             return
-        self.current_entry.text = self.translation_text.get("0.0", "end-1c").replace("\n", r"\N")
+        text = self.translation_text.get("0.0", "end-1c").replace("\n", r"\N")
+        if text == self.current_entry.text:
+            return  # Navigation and modifier keys leave the entry clean
+        self.current_entry.text = text
+        self.document.invalidate(self.current_entry)
+        if self._edit_refresh_job is not None:
+            self.after_cancel(self._edit_refresh_job)
+        self._edit_refresh_job = self.after(self.EDIT_REFRESH_MS, self._run_edit_refresh)
+
+    def _run_edit_refresh(self):
+        self._edit_refresh_job = None
         self._entry_was_changed()
 
     def _on_timing_changed(self, _event=None):
@@ -526,6 +622,7 @@ class SubtitleReviewPanel(ctk.CTkFrame):
         end_ms = self._parse_time(self.end_input.get())
         self.current_entry.start_ms = start_ms
         self.current_entry.end_ms = end_ms
+        self.document.invalidate(self.current_entry)
         self.start_input.configure(border_color=COLORS["border"])
         self.end_input.configure(border_color=COLORS["border"])
 
@@ -535,21 +632,34 @@ class SubtitleReviewPanel(ctk.CTkFrame):
         if (
             self.filter_value == "All"
             and not self.search_entry.get().strip()
-            and self.current_entry in self.filtered_entries
+            and self._row_of(self.current_entry) is not None
         ):
-            index = self.filtered_entries.index(self.current_entry)
-            self.listbox.delete(index)
-            self.listbox.insert(index, self._row_text(self.current_entry))
-            issues = self.document.issues_for(self.current_entry)
-            if any(issue.severity == "error" for issue in issues):
-                self.listbox.itemconfig(index, foreground=COLORS["error"])
-            elif issues:
-                self.listbox.itemconfig(index, foreground=COLORS["warning"])
-            self.listbox.selection_set(index)
-            self.listbox.activate(index)
+            self._redraw_current_row()
         else:
             self._apply_filter()
 
+    def _draw_row(self, index: int, entry: ReviewEntry):
+        text, color = self._row_display(entry)
+        self.listbox.delete(index)
+        self.listbox.insert(index, text)
+        if color:
+            self.listbox.itemconfig(index, foreground=color)
+
+    def _redraw_current_row(self):
+        """Rewrite the current entry's list row in place and keep it selected."""
+        index = self._row_of(self.current_entry)
+        self._draw_row(index, self.current_entry)
+        self.listbox.selection_set(index)
+        self.listbox.activate(index)
+
+        # Overlap/gap issues of the next entry depend on this one's timing
+        entries = self.document.entries
+        position = self.current_entry.display_number  # Next entry's list position
+        if position < len(entries):
+            next_index = self._row_of(entries[position])
+            if next_index is not None:
+                self._draw_row(next_index, entries[position])
+
     def _update_entry_status(self):
         if not self.current_entry:
             return
@@ -565,10 +675,15 @@ class SubtitleReviewPanel(ctk.CTkFrame):
             self.entry_status.configure(text=f"{duration:.2f}s", text_color=COLORS["text_muted"])
 
     def _update_summary(self):
-        issues = self.document.validate()
-        errors = sum(issue.severity == "error" for issue in issues)
-        warnings = sum(issue.severity == "warning" for issue in issues)
-        edited = sum(entry.modified for entry in self.document.entries)
+        # One pass over the entries counts edits and issue severities together
+        errors = warnings = edited = 0
+        for entry in self.document.entries:
+            edited += entry.modified
+            for issue in self.document.issues_for(entry):
+                if issue.severity == "error":
+                    errors += 1
+                elif issue.severity == "warning":
+                    warnings += 1
         self.summary_label.configure(
             text=f"{len(self.document.entries)} entries | {edited} edited | {errors} errors | {warnings} warnings",
             text_color=COLORS["error"] if errors else (COLORS["warning"] if warnings else COLORS["text_muted"]),
@@ -577,10 +692,7 @@ class SubtitleReviewPanel(ctk.CTkFrame):
     def _move_selection(self, offset: int):
         if not self.filtered_entries:
             return
-        try:
-            current = self.filtered_entries.index(self.current_entry)
-        except ValueError:
-            current = 0
+        current = self._row_of(self.current_entry) or 0
         target = max(0, min(len(self.filtered_entries) - 1, current + offset))
         self.listbox.selection_clear(0, "end")
         self.listbox.selection_set(target)
@@ -593,11 +705,8 @@ class SubtitleReviewPanel(ctk.CTkFrame):
             if self.document.issues_for(entry)
         ]
         if not issue_entries:
-            messagebox.showinfo(
-                "Subtitle validation",
-                "No remaining subtitle issues.",
-                parent=self.winfo_toplevel(),
-            )
+            # Report inline; a modal dialog here would block the event loop for a non-event
+            self.entry_status.configure(text="No remaining subtitle issues", text_color=COLORS["success"])
             return
 
         self.filter_control.set("Issues")
@@ -636,26 +745,34 @@ class SubtitleReviewPanel(ctk.CTkFrame):
                 messagebox.showerror("Invalid timing", str(error), parent=self.winfo_toplevel())
                 return
 
-        issues = self.document.validate()
-        errors = [issue for issue in issues if issue.severity == "error"]
-        warnings = [issue for issue in issues if issue.severity == "warning"]
-
-        if errors:
+        # Count issues in one pass; only the errors shown in the dialog are kept
+        shown_errors = []
+        error_count = warning_count = 0
+        for entry in self.document.entries:
+            for issue in self.document.issues_for(entry):
+                if issue.severity == "error":
+                    error_count += 1
+                    if len(shown_errors) < 6:
+                        shown_errors.append(issue)
+                elif issue.severity == "warning":
+                    warning_count += 1
+
+        if error_count:
             details = "\n".join(
-                f"Entry {issue.entry_number}: {issue.message}" for issue in errors[:6]
+                f"Entry {issue.entry_number}: {issue.message}" for issue in shown_errors
             )
             messagebox.showerror(
                 "Cannot merge subtitles",
-                f"Fix {len(errors)} validation error(s) before merging.\n\n{details}",
+                f"Fix {error_count} validation error(s) before merging.\n\n{details}",
                 parent=self.winfo_toplevel(),
             )
             self.filter_control.set("Issues")
             self._set_filter("Issues")
             return
 
-        if warnings and not messagebox.askyesno(
+        if warning_count and not messagebox.askyesno(
             "Merge with warnings?",
-            f"The subtitle has {len(warnings)} warning(s). Continue with merge?",
+            f"The subtitle has {warning_count} warning(s). Continue with merge?",
             parent=self.winfo_toplevel(),
         ):
             self.filter_control.set("Issues")
@@ -693,3 +810,9 @@ class SubtitleReviewPanel(ctk.CTkFrame):
         self.approve_button.configure(state="normal", text="Approve & Merge")
         self.merge_progress.grid_remove()
         self._update_summary()
+
+    def destroy(self):
+        if self._edit_refresh_job is not None:
+            self.after_cancel(self._edit_refresh_job)
+            self._edit_refresh_job = None
+        super().destroy()
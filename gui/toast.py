@@ -9,6 +9,22 @@ from typing import Optional, Callable
 from .styles import COLORS, FONTS, SPACING, RADIUS
 
 
+# Toast variant -> (accent color, background color)
+_TOAST_COLORS = {
+    "info": (COLORS["info"], COLORS["info_bg"]),
+    "success": (COLORS["success"], COLORS["success_bg"]),
+    "warning": (COLORS["warning"], COLORS["warning_bg"]),
+    "error": (COLORS["error"], COLORS["error_bg"]),
+}
+
+_TOAST_ICONS = {
+    "info": "ℹ️",
+    "success": "✓",
+    "warning": "⚠",
+    "error": "✕",
+}
+
+
 class Toast(ctk.CTkFrame):
     """
     A toast notification that appears at the bottom of the window.
@@ -26,23 +42,8 @@ class Toast(ctk.CTkFrame):
         on_dismiss: Optional[Callable] = None,
         **kwargs
     ):
-        # Get colors based on variant
-        color_map = {
-            "info": (COLORS["info"], COLORS["info_bg"]),
-            "success": (COLORS["success"], COLORS["success_bg"]),
-            "warning": (COLORS["warning"], COLORS["warning_bg"]),
-            "error": (COLORS["error"], COLORS["error_bg"]),
-        }
-        
-        icon_map = {
-            "info": "ℹ️",
-            "success": "✓",
-            "warning": "⚠",
-            "error": "✕",
-        }
-        
-        accent_color, bg_color = color_map.get(variant, color_map["info"])
-        icon = icon_map.get(variant, "ℹ️")
+        accent_color, bg_color = _TOAST_COLORS.get(variant, _TOAST_COLORS["info"])
+        icon = _TOAST_ICONS.get(variant, "ℹ️")
         
         super().__init__(
             master,
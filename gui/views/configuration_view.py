@@ -4,7 +4,7 @@ Handles subtitle track selection, language settings, and model configuration.
 """
 
 import customtkinter as ctk
-from typing import List, Callable, Optional, Any
+from typing import List, Dict, Callable, Optional, Any
 from ..styles import (
     COLORS, FONTS, SPACING, RADIUS, 
     get_label_style, get_button_style
@@ -14,6 +14,8 @@ from ..components import CollapsibleFrame, TrackListItem, SettingsRow
 class ConfigurationView(ctk.CTkFrame):
     """View for Step 2: Configuration (Tracks + Options)."""
     
+    TRACK_WINDOW = 20  # Track rows built at a time; the rest are built on request
+    
     def __init__(
         self, 
         master, 
@@ -112,6 +114,18 @@ class ConfigurationView(ctk.CTkFrame):
         self.external_subtitle_btn.pack(side="right")
         
         self.track_items: List[TrackListItem] = []
+        self.track_items_by_id: Dict[int, TrackListItem] = {}
+        self._track_item_pool: List[TrackListItem] = []
+        self._tracks: List[Any] = []
+        self._track_index: Dict[int, int] = {}
+        self._on_track_select: Optional[Callable[[int, bool], None]] = None
+        
+        self.more_tracks_btn = ctk.CTkButton(
+            self.tracks_frame,
+            text="",
+            command=lambda: self._build_track_rows(self.TRACK_WINDOW),
+            **get_button_style("ghost")
+        )
         
         # === Translation Options Section ===
         self.options_section = CollapsibleFrame(self.scroll_container, title="Translation Settings")
@@ -214,12 +228,21 @@ class ConfigurationView(ctk.CTkFrame):
         
 
 
+    def release_tracks(self):
+        """Hide the current track items and return them to the reuse pool."""
+        for item in self.track_items:
+            item.grid_remove()
+        self._track_item_pool.extend(self.track_items)
+        self.track_items.clear()
+        self.track_items_by_id.clear()
+        self._tracks = []
+        self._track_index = {}
+        self.more_tracks_btn.grid_remove()
+
     def update_tracks(self, tracks: List[Any], selected_id: Optional[int], on_track_select: Callable[[int, bool], None]):
         """Update the list of subtitle tracks."""
         # Clear existing
-        for item in self.track_items:
-            item.destroy()
-        self.track_items.clear()
+        self.release_tracks()
         
         if not tracks:
             self.no_tracks_label.grid(row=0, column=0, pady=SPACING["lg"])
@@ -227,20 +250,61 @@ class ConfigurationView(ctk.CTkFrame):
             
         self.no_tracks_label.grid_forget()
         
-        for i, track in enumerate(tracks):
-            item = TrackListItem(
-                self.tracks_frame,
-                track_id=track.track_id,
-                language=track.language,
-                track_name=track.track_name,
-                codec=track.codec,
-                is_default=track.default_track,
-                on_select=on_track_select
-            )
+        self._tracks = list(tracks)
+        self._track_index = {t.track_id: i for i, t in enumerate(self._tracks)}
+        self._on_track_select = on_track_select
+        self._build_track_rows(self.TRACK_WINDOW)
+        
+        if selected_id is not None:
+            item = self.get_track_item(selected_id)
+            if item:
+                item.is_selected.set(True)
+
+    def get_track_item(self, track_id: int) -> Optional[TrackListItem]:
+        """Get the row for a track, building it (and the rows above it) if needed."""
+        index = self._track_index.get(track_id)
+        if index is not None and index >= len(self.track_items):
+            self._build_track_rows(index + 1 - len(self.track_items))
+        return self.track_items_by_id.get(track_id)
+
+    def _build_track_rows(self, count: int):
+        """Build the next count track rows, reusing pooled items where possible."""
+        start = len(self.track_items)
+        end = min(len(self._tracks), start + count)
+        on_track_select = self._on_track_select
+        
+        for i in range(start, end):
+            track = self._tracks[i]
+            if self._track_item_pool:
+                item = self._track_item_pool.pop()
+                item.recycle(
+                    track_id=track.track_id,
+                    language=track.language,
+                    track_name=track.track_name,
+                    codec=track.codec,
+                    is_default=track.default_track,
+                    on_select=on_track_select
+                )
+            else:
+                item = TrackListItem(
+                    self.tracks_frame,
+                    track_id=track.track_id,
+                    language=track.language,
+                    track_name=track.track_name,
+                    codec=track.codec,
+                    is_default=track.default_track,
+                    on_select=on_track_select
+                )
             item.grid(row=i, column=0, sticky="ew", pady=SPACING["xs"])
-            if track.track_id == selected_id:
-                item.set_selected(True)
             self.track_items.append(item)
+            self.track_items_by_id[track.track_id] = item
+        
+        remaining = len(self._tracks) - end
+        if remaining:
+            self.more_tracks_btn.configure(text=f"Show more tracks ({remaining} hidden)")
+            self.more_tracks_btn.grid(row=len(self._tracks), column=0, sticky="ew", pady=SPACING["xs"])
+        else:
+            self.more_tracks_btn.grid_remove()
 
     def show_external_subtitle_option(self, show: bool, selected_path: Optional[str] = None):
         """Show the external subtitle fallback when no embedded text track exists."""
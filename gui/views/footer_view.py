@@ -9,6 +9,7 @@ from ..styles import (
     COLORS, FONTS, SPACING, 
     get_button_style, get_label_style
 )
+from ..constants import FOOTER_HEIGHT
 
 class FooterView(ctk.CTkFrame):
     """Footer view with action buttons."""
@@ -22,7 +23,7 @@ class FooterView(ctk.CTkFrame):
         on_cancel: Optional[Callable[[], None]] = None,
         **kwargs
     ):
-        super().__init__(master, fg_color="transparent", height=60, **kwargs)
+        super().__init__(master, fg_color="transparent", height=FOOTER_HEIGHT, **kwargs)
         self.on_pause = on_pause
         self.on_cancel = on_cancel
         self.grid_columnconfigure(0, weight=1)
@@ -88,8 +89,9 @@ class FooterView(ctk.CTkFrame):
         # resume_btn is initially hidden
         
     def set_status(self, text: str, color: Optional[str] = None):
-        """Update status label."""
-        self.status_label.configure(text=text)
+        """Update status label, skipping the redraw if nothing changed."""
+        if text != self.status_label.cget("text"):
+            self.status_label.configure(text=text)
         if color:
             self.status_label.configure(text_color=color)
 
@@ -3,11 +3,13 @@ Review View for Sub-auto
 Handles Step 4 (Review) of the translation wizard.
 """
 
+import threading
 import customtkinter as ctk
 from typing import Callable, Optional, Dict, Any
 
 from ..styles import SPACING, get_label_style
 from ..components import SubtitleReviewPanel
+from ..subtitle_review_panel import ReviewDocument
 
 class ReviewView(ctk.CTkFrame):
     """View for reviewing and approving translated subtitles."""
@@ -23,6 +25,7 @@ class ReviewView(ctk.CTkFrame):
         self.on_discard = on_discard
         self.payload: Optional[Dict[str, Any]] = None
         self.editor_view: Optional[any] = None
+        self._load_generation = 0  # Bumped per payload so stale loads are dropped
         
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -45,6 +48,13 @@ class ReviewView(ctk.CTkFrame):
         # Container for the actual editor
         self.editor_container = ctk.CTkFrame(self, fg_color="transparent")
         self.editor_container.grid(row=1, column=0, sticky="nsew")
+        
+        # Shown while a payload's subtitles are parsed in the background
+        self.loading_label = ctk.CTkLabel(
+            self.editor_container,
+            text="Loading subtitles...",
+            **get_label_style("muted")
+        )
 
     def show_payload(self, payload: Dict[str, Any]):
         """Load and display a translation payload for review."""
@@ -52,26 +62,62 @@ class ReviewView(ctk.CTkFrame):
         self._refresh_editor()
 
     def _refresh_editor(self):
-        """Create the editor for the current translation payload."""
+        """Parse the current translation payload in the background, then show the editor."""
         if not self.payload:
             return
             
-        # Clean up existing
+        # Keep the existing editor for reuse, hidden until the new document is ready
         if self.editor_view:
-            self.editor_view.destroy()
-            
-        subtitle_path = self.payload["translated_sub_path"]
+            self.editor_view.pack_forget()
         
-        self.editor_view = SubtitleReviewPanel(
-            self.editor_container,
-            subtitle_path=subtitle_path,
-            source_path=self.payload.get("source_subtitle_path"),
-            translation_issues=self.payload.get("translation_issues"),
-            on_approve=self.on_approve,
-            on_discard=self.on_discard
-        )
+        self._load_generation += 1
+        self.loading_label.configure(text="Loading subtitles...")
+        self.loading_label.pack(pady=SPACING["lg"])
+        threading.Thread(
+            target=self._load_document,
+            args=(self._load_generation, self.payload),
+            daemon=True
+        ).start()
+    
+    def _load_document(self, generation: int, payload: Dict[str, Any]):
+        """Parse subtitle files off the Tk thread (runs in background thread)."""
+        try:
+            document = ReviewDocument(
+                payload["translated_sub_path"],
+                payload.get("source_subtitle_path"),
+                payload.get("translation_issues"),
+            )
+            # Validate here so the panel's first summary, filter and row colors
+            # are served from the document's issue cache instead of the Tk thread
+            document.validate()
+        except Exception as e:
+            self.after(0, lambda e=e: self._show_load_error(generation, str(e)))
+            return
+        self.after(0, lambda: self._show_document(generation, document))
+    
+    def _show_document(self, generation: int, document: ReviewDocument):
+        """Show the editor for a parsed document unless a newer payload replaced it."""
+        if generation != self._load_generation:
+            return
+        self.loading_label.pack_forget()
+        
+        if self.editor_view:
+            self.editor_view.load_document(document)
+        else:
+            self.editor_view = SubtitleReviewPanel(
+                self.editor_container,
+                subtitle_path=self.payload["translated_sub_path"],
+                on_approve=self.on_approve,
+                on_discard=self.on_discard,
+                document=document
+            )
             
         self.editor_view.pack(fill="both", expand=True)
+    
+    def _show_load_error(self, generation: int, error: str):
+        if generation != self._load_generation:
+            return
+        self.loading_label.configure(text=f"Failed to load subtitles: {error}")
 
     def set_merge_progress(self, percent: int):
         if self.editor_view:
@@ -3,10 +3,27 @@ Window utility functions for the Sub-auto GUI.
 """
 
 import ctypes
+import os
+import subprocess
+import sys
+import threading
 from core.logger import get_logger
 
 logger = get_logger()
 
+
+def open_folder(path: str):
+    """Open a folder in the system file manager without blocking the UI thread."""
+    try:
+        if sys.platform == "win32":
+            # os.startfile can stall while Explorer starts; run it off the Tk thread
+            threading.Thread(target=os.startfile, args=(path,), daemon=True).start()
+        else:
+            opener = "open" if sys.platform == "darwin" else "xdg-open"
+            subprocess.Popen([opener, path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except Exception as e:
+        logger.warning(f"Failed to open folder {path}: {e}")
+
 def setup_window_style(window):
     """Setup Windows-specific window styling (shadows and rounded corners)."""
     try: